@@ -15,6 +15,13 @@ from monte_carlo_runner import (
 )
 from scenario_manager import ScenarioManager
 
+# Metric groups shown as side-by-side boxplots in the comparison section
+BOXPLOT_GROUPS = [
+    ("Core Metrics Comparison", ['avg_resilience', 'avg_service_level', 'avg_cost_impact']),
+    ("Risk and Recovery Analysis", ['avg_risk_exposure', 'avg_recovery_time']),
+    ("Performance Metrics", ['transportation_efficiency', 'inventory_health'])
+]
+
 def run_multiple_scenarios(scenarios: List[str], use_custom_scenario: bool, parameter_updates: Dict = None):
     """Run multiple scenarios concurrently and compare results"""
     
@@ -63,6 +70,12 @@ def run_multiple_scenarios(scenarios: List[str], use_custom_scenario: bool, para
             all_stats[scenario] = stats
             all_figures[scenario] = figures
         
+        # Downcast metric columns to float32 - plots and the CSV export don't need
+        # float64 precision, and this halves the memory and file size
+        for df in all_results:
+            float_cols = df.select_dtypes('float64').columns
+            df[float_cols] = df[float_cols].astype('float32')
+
         # Combine results for comparison
         combined_results = pd.concat(all_results, ignore_index=True)
         
@@ -234,57 +247,30 @@ def run_multiple_scenarios(scenarios: List[str], use_custom_scenario: bool, para
         # Generate timestamp for saving files
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Core Metrics Comparison with horizontal subplots
-        st.markdown("**Core Metrics Comparison**")
-        fig_metrics, axes = plt.subplots(1, 3, figsize=(20, 6))
-        metrics = ['avg_resilience', 'avg_service_level', 'avg_cost_impact']
-        for idx, metric in enumerate(metrics):
-            sns.boxplot(data=combined_results, x='scenario', y=metric, ax=axes[idx])
-            axes[idx].set_title(metric.replace('avg_', '').replace('_', ' ').title(), pad=20)
-            axes[idx].tick_params(axis='x', rotation=45)
-            axes[idx].set_xlabel('')
-        plt.tight_layout()
-        st.pyplot(fig_metrics)
-        plt.close()
-        
-        # Risk and Recovery Analysis with horizontal subplots
-        st.markdown("**Risk and Recovery Analysis**")
-        fig_risk, axes = plt.subplots(1, 2, figsize=(20, 6))
-        metrics = ['avg_risk_exposure', 'avg_recovery_time']
-        for idx, metric in enumerate(metrics):
-            sns.boxplot(data=combined_results, x='scenario', y=metric, ax=axes[idx])
-            axes[idx].set_title(metric.replace('avg_', '').replace('_', ' ').title(), pad=20)
-            axes[idx].tick_params(axis='x', rotation=45)
-            axes[idx].set_xlabel('')
-        plt.tight_layout()
-        st.pyplot(fig_risk)
-        plt.close()
-        
-        # Performance Metrics with horizontal subplots
-        st.markdown("**Performance Metrics**")
-        fig_perf, axes = plt.subplots(1, 2, figsize=(20, 6))
-        metrics = ['transportation_efficiency', 'inventory_health']
-        for idx, metric in enumerate(metrics):
-            sns.boxplot(data=combined_results, x='scenario', y=metric, ax=axes[idx])
-            axes[idx].set_title(metric.replace('_', ' ').title(), pad=20)
-            axes[idx].tick_params(axis='x', rotation=45)
-            axes[idx].set_xlabel('')
-        plt.tight_layout()
-        st.pyplot(fig_perf)
-        plt.close()
+        # Boxplot comparisons, one figure per metric group with horizontal subplots
+        for title, metrics in BOXPLOT_GROUPS:
+            st.markdown(f"**{title}**")
+            fig, axes = plt.subplots(1, len(metrics), figsize=(20, 6))
+            for ax, metric in zip(axes, metrics):
+                sns.boxplot(data=combined_results, x='scenario', y=metric, ax=ax)
+                ax.set_title(metric.replace('avg_', '').replace('_', ' ').title(), pad=20)
+                ax.tick_params(axis='x', rotation=45)
+                ax.set_xlabel('')
+            plt.tight_layout()
+            st.pyplot(fig)
+            plt.close(fig)
         
         # Cost vs. Resilience Trade-off
         st.markdown("**Cost vs. Resilience Trade-off**")
         fig_trade = plt.figure(figsize=(20, 6))
-        for scenario in scenarios:
-            scenario_data = combined_results[combined_results['scenario'] == scenario]
-            plt.scatter(scenario_data['avg_cost_impact'], 
-                      scenario_data['avg_resilience'],
-                      label=scenario, alpha=0.6, s=100)  # Increased marker size
-        plt.title('Cost vs. Resilience Trade-off', pad=20)
-        plt.xlabel('Cost Impact')
-        plt.ylabel('Resilience Score')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        # Single hue-mapped call instead of one scatter (and one filtered copy) per scenario
+        ax = sns.scatterplot(data=combined_results, x='avg_cost_impact', y='avg_resilience',
+                             hue='scenario', hue_order=scenarios,
+                             alpha=0.6, s=100)  # Increased marker size
+        ax.set_title('Cost vs. Resilience Trade-off', pad=20)
+        ax.set_xlabel('Cost Impact')
+        ax.set_ylabel('Resilience Score')
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         plt.tight_layout()
         st.pyplot(fig_trade)
         plt.close()
@@ -310,35 +296,36 @@ def run_multiple_scenarios(scenarios: List[str], use_custom_scenario: bool, para
         results_csv = f"simulation_results/{timestamp}_comparative_results.csv"
         config_json = f"simulation_results/{timestamp}_simulation_configs.json"
         
-        # Save files
-        combined_results.to_csv(results_csv, index=False)
+        # Serialize once and reuse the bytes for both the saved file and the download button
+        csv_bytes = combined_results.to_csv(index=False).encode()
+        with open(results_csv, 'wb') as f:
+            f.write(csv_bytes)
         
         # Save all configurations
         configs = {
             scenario: (ScenarioManager.create_custom_config('baseline', parameter_updates)
                      if scenario == 'custom' 
-                     else ScenarioManager.get_scenario_config(scenario))
+                     else ScenarioManager.get_scenario_config_readonly(scenario))
             for scenario in scenarios
         }
-        with open(config_json, 'w') as f:
-            json.dump(configs, f, indent=2)
+        config_bytes = json.dumps(configs, indent=2, default=dict).encode()  # default=dict for the read-only mappings
+        with open(config_json, 'wb') as f:
+            f.write(config_bytes)
         
         with col1:
-            with open(results_csv, 'rb') as f:
-                st.download_button(
-                    "Download Combined Results CSV",
-                    f,
-                    results_csv.split('/')[-1],
-                    "text/csv"
-                )
+            st.download_button(
+                "Download Combined Results CSV",
+                csv_bytes,
+                results_csv.split('/')[-1],
+                "text/csv"
+            )
         with col2:
-            with open(config_json, 'rb') as f:
-                st.download_button(
-                    "Download All Configurations JSON",
-                    f,
-                    config_json.split('/')[-1],
-                    "application/json"
-                )
+            st.download_button(
+                "Download All Configurations JSON",
+                config_bytes,
+                config_json.split('/')[-1],
+                "application/json"
+            )
         with col3:
             st.markdown("""
             **Results Location**  
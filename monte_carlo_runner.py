@@ -20,16 +20,19 @@ The simulation uses TinyTroupe's agent-based modeling capabilities to represent:
 """
 
 import os
-import random
 import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; figures are only saved or handed to Streamlit
 import matplotlib.pyplot as plt
+from matplotlib.patches import Patch
 import seaborn as sns
 from typing import Dict, Any, List, Tuple, Optional, Callable
 from datetime import datetime
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from supply_chain_config import DEFAULT_CONFIG
+from scenario_manager import _clone_config
 from supply_chain_agents import (
     create_coo_agent,
     create_regional_manager_agent,
@@ -61,44 +64,73 @@ class ScenarioConfig:
         """
         return DEFAULT_CONFIG
     
+    @staticmethod
+    def _copy_regions(overrides_per_region: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a scenario config from DEFAULT_CONFIG with per-region overrides
+        
+        Only the top level and the regions are copied; every other section is shared
+        with DEFAULT_CONFIG, in the same way get_baseline_config shares it entirely.
+        
+        Args:
+            overrides_per_region: Function mapping a default region dict to the fields to change
+        
+        Returns:
+            Dict[str, Any]: Scenario configuration
+        """
+        config = dict(DEFAULT_CONFIG)
+        config['regions'] = {
+            name: {**region, **overrides_per_region(region)}
+            for name, region in DEFAULT_CONFIG['regions'].items()
+        }
+        return config
+    
     @staticmethod
     def get_supplier_disruption_config():
         """Configuration for supplier disruption scenario"""
-        config = deepcopy(DEFAULT_CONFIG)
         # Increase probability of supplier-related disruptions
-        for region in config['regions'].values():
-            region['disaster_probability'] *= 2
-        return config
+        return ScenarioConfig._copy_regions(lambda region: {
+            'disaster_probability': region['disaster_probability'] * 2
+        })
     
     @staticmethod
     def get_transportation_disruption_config():
         """Configuration for transportation disruption scenario"""
-        config = deepcopy(DEFAULT_CONFIG)
         # Decrease infrastructure quality to simulate transportation issues
-        for region in config['regions'].values():
-            region['infrastructure_quality'] *= 0.7
-        return config
+        return ScenarioConfig._copy_regions(lambda region: {
+            'infrastructure_quality': region['infrastructure_quality'] * 0.7
+        })
     
     @staticmethod
     def get_production_disruption_config():
         """Configuration for production facility disruption scenario"""
-        config = deepcopy(DEFAULT_CONFIG)
         # Decrease production capacity and increase disruption probability
-        for region in config['regions'].values():
-            region['production_capacity'] = region.get('production_capacity', 1.0) * 0.6
-            region['disaster_probability'] *= 1.5
-        return config
+        return ScenarioConfig._copy_regions(lambda region: {
+            'production_capacity': region.get('production_capacity', 1.0) * 0.6,
+            'disaster_probability': region['disaster_probability'] * 1.5
+        })
     
     @staticmethod
     def get_multi_factor_disruption_config():
         """Configuration for multi-factor disruption scenario"""
-        config = deepcopy(DEFAULT_CONFIG)
         # Combine multiple disruption factors
-        for region in config['regions'].values():
-            region['disaster_probability'] *= 1.8
-            region['infrastructure_quality'] *= 0.8
-            region['production_capacity'] = region.get('production_capacity', 1.0) * 0.7
-        return config
+        return ScenarioConfig._copy_regions(lambda region: {
+            'disaster_probability': region['disaster_probability'] * 1.8,
+            'infrastructure_quality': region['infrastructure_quality'] * 0.8,
+            'production_capacity': region.get('production_capacity', 1.0) * 0.7
+        })
+
+# Per-iteration metrics summarized (mean and std) by analyze_results
+CORE_METRIC_COLUMNS = [
+    'avg_resilience',
+    'avg_cost_impact',
+    'avg_service_level',
+    'avg_recovery_time',
+    'avg_risk_exposure',
+    'transportation_efficiency',
+    'inventory_health',
+    'avg_roi'
+]
 
 class MonteCarloSimulation:
     """
@@ -117,14 +149,34 @@ class MonteCarloSimulation:
     - Recovery Time: Speed of return to normal operations
     - Risk Exposure: Current threat level to operations
     """
-    def __init__(self, config: Dict[str, Any] = None, scenario_name: str = "baseline"):
+    def __init__(self, config: Dict[str, Any] = None, scenario_name: str = "baseline",
+                 max_workers: Optional[int] = None):
         self.config = config or DEFAULT_CONFIG
-        self.results = []
+        self.max_workers = max_workers  # Worker processes for iterations (None: one per CPU, 1: run in-process)
+        self.df_results: Optional[pd.DataFrame] = None  # Results of the last run, built once in run()
         self.agents = {}
+        self.world: Optional[SupplyChainWorld] = None  # Built on first use, then reset between iterations
+        self._region_names = tuple(self.config['regions'])
+        self._agent_keys = tuple(
+            (region, f'manager_{region}', f'supplier_{region}') for region in self._region_names
+        )
+        self._supplier_cols = [f'supplier_performance_{region}' for region in self._region_names]
         self.scenario_name = scenario_name
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # Make sure the output directory exists and build the plot file prefix once
+        os.makedirs('simulation_results', exist_ok=True)
+        self._out_prefix = f'simulation_results/{self.timestamp}_{self.scenario_name}_experimental_'
+        
         self.figures = {}  # Store generated figures
         
+    @property
+    def results(self) -> List[Dict[str, Any]]:
+        """Per-iteration results of the last run as a list of records"""
+        if self.df_results is None:
+            return []
+        return self.df_results.to_dict('records')
+        
     def _initialize_agents(self):
         """Initialize supply chain agents"""
         self.agents = {}
@@ -137,27 +189,38 @@ class MonteCarloSimulation:
         )
         
         # Create regional managers and suppliers
-        for region in self.config['regions'].keys():
+        for region, manager_key, supplier_key in self._agent_keys:
             # Regional manager
-            self.agents[f'manager_{region}'] = SupplyChainAgent(
-                name=f'manager_{region}',
+            self.agents[manager_key] = SupplyChainAgent(
+                name=manager_key,
                 role='Regional_Manager',
                 region=region,
                 config=self.config['regional_manager']
             )
             
             # Supplier
-            self.agents[f'supplier_{region}'] = SupplyChainAgent(
-                name=f'supplier_{region}',
+            self.agents[supplier_key] = SupplyChainAgent(
+                name=supplier_key,
                 role='Supplier',
                 region=region,
                 config=self.config['supplier']
             )
+        
+        # Regional managers and suppliers decide together in one batched call per week
+        self._regional_agents = [
+            self.agents[key]
+            for _, manager_key, supplier_key in self._agent_keys
+            for key in (manager_key, supplier_key)
+        ]
             
     def run(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> pd.DataFrame:
         """
         Run Monte Carlo simulation with optional progress reporting
         
+        Iterations are independent, so they are distributed across a process pool.
+        Each iteration gets its own seed spawned from the configured seed, which
+        keeps results reproducible regardless of how iterations are scheduled.
+        
         Args:
             progress_callback: Optional callback function(current_iteration, total_iterations)
                              for progress reporting
@@ -165,269 +228,366 @@ class MonteCarloSimulation:
         Returns:
             pd.DataFrame: Results of all iterations
         """
-        np.random.seed(self.config['simulation']['seed'])
         total_iterations = self.config['simulation']['monte_carlo_iterations']
-        
-        for iteration in range(total_iterations):
-            # Clear TinyTroupe registries before each iteration
+        seed_sequence = np.random.SeedSequence(self.config['simulation']['seed'])
+        seeds = seed_sequence.spawn(total_iterations)  # Independent random streams, one per iteration
+        max_workers = min(self.max_workers or os.cpu_count() or 1, total_iterations)
+        
+        if max_workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                # Read-only configs (MappingProxyType trees) cannot be pickled for spawned workers
+                initargs=(_clone_config(self.config), self.scenario_name)
+            )
+            # Batch several iterations per task to amortize pickling/IPC overhead
+            chunksize = max(1, total_iterations // (max_workers * 4))
+            iteration_results = executor.map(
+                _run_one_iteration,
+                enumerate(seeds),
+                chunksize=chunksize
+            )
+        else:
+            executor = None
+            iteration_results = map(self._run_seeded_iteration, range(total_iterations), seeds)
+        
+        # Metrics are written row by row into a preallocated array; the schema is
+        # fixed, so it is taken from the first iteration's summary
+        metric_columns: List[str] = []
+        metric_arr = np.empty((0, 0))
+        try:
+            for iteration, result in enumerate(iteration_results):
+                if iteration == 0:
+                    metric_columns = list(result)
+                    metric_arr = np.empty((total_iterations, len(metric_columns)), dtype=np.float64)
+                metric_arr[iteration] = [result[column] for column in metric_columns]
+                
+                # Report progress if callback provided
+                if progress_callback:
+                    progress_callback(iteration + 1, total_iterations)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        # Build the results DataFrame exactly once
+        self.df_results = pd.DataFrame(metric_arr, columns=metric_columns)
+        self.df_results['scenario'] = pd.Categorical([self.scenario_name] * total_iterations)
+        self.df_results['iteration'] = np.arange(total_iterations)
+        return self.df_results
+    
+    def _run_seeded_iteration(self, iteration: int, seed: np.random.SeedSequence) -> Dict[str, float]:
+        """Reset the world and agents, then run one seeded iteration"""
+        if self.world is None:
+            # Build the world and agents once; TinyTroupe names must be unique, so
+            # registries are cleared before (re)creating them
             TinyWorld.all_environments.clear()  # Clear environment registry
             TinyPerson.all_agents.clear()  # Clear agent registry
-            
-            # Initialize world and agents for this iteration
-            world = SupplyChainWorld(self.config)
+            self.world = SupplyChainWorld(self.config)
             self._initialize_agents()
-            
-            # Run single iteration
-            iteration_results = self._run_iteration(world)
-            iteration_results['scenario'] = self.scenario_name
-            iteration_results['iteration'] = iteration
-            self.results.append(iteration_results)
-            
-            # Report progress if callback provided
-            if progress_callback:
-                progress_callback(iteration + 1, total_iterations)
         
-        # Convert results to DataFrame
-        return pd.DataFrame(self.results)
+        # Reuse the world and agents in place instead of reconstructing them; they all
+        # draw from one generator seeded for this iteration
+        rng = np.random.default_rng(seed)
+        self.world.reset(rng)
+        for agent in self.agents.values():
+            agent.reset(rng)
+        
+        # Run single iteration
+        return self._run_iteration(self.world)
             
     def _run_iteration(self, world: SupplyChainWorld) -> Dict[str, float]:
         """Run a single iteration of the simulation"""
         simulation_length = self.config['simulation']['simulation_length_weeks']
+        coo = self.agents['coo']
+        regional_agents = self._regional_agents
         
         for week in range(simulation_length):
             # Update world state
             state = world.step()
             
             # COO decision making
-            coo_decisions = self.agents['coo'].make_decision(world)
+            coo_decisions = coo.make_decision(world)
             
             # Regional managers and suppliers decision making
-            for region in self.config['regions'].keys():
-                manager = self.agents[f'manager_{region}']
-                supplier = self.agents[f'supplier_{region}']
-                
-                manager_decisions = manager.make_decision(world)
-                supplier_decisions = supplier.make_decision(world)
+            regional_decisions = SupplyChainAgent.make_decisions_batch(regional_agents, world)
                 
         # Return metrics summary for this iteration
         return world.get_metrics_summary()
         
-    def analyze_results(self) -> Tuple[Dict[str, float], Dict[str, plt.Figure]]:
+    def analyze_results(self, plot: bool = True) -> Tuple[Dict[str, float], Dict[str, plt.Figure]]:
         """
         Analyze simulation results and generate visualizations
         
+        Args:
+            plot: Whether to also render and save the figures (see plot_results); pass
+                False when only the statistics are needed
+        
         Returns:
             Tuple[Dict[str, float], Dict[str, plt.Figure]]: 
-                (statistics, generated figures)
+                (statistics, generated figures; empty when plot is False)
         """
-        df_results = pd.DataFrame(self.results)
+        summary = self._summarize_results()
+        mean, std = summary.loc['mean'], summary.loc['std']
         
         # Calculate aggregate statistics
         stats = {
-            'avg_resilience': df_results['avg_resilience'].mean(),
-            'std_resilience': df_results['avg_resilience'].std(),
-            'avg_cost': df_results['avg_cost_impact'].mean(),
-            'std_cost': df_results['avg_cost_impact'].std(),
-            'avg_service_level': df_results['avg_service_level'].mean(),
-            'std_service_level': df_results['avg_service_level'].std(),
-            'avg_recovery_time': df_results['avg_recovery_time'].mean(),
-            'avg_risk_exposure': df_results['avg_risk_exposure'].mean(),
-            'avg_transportation_efficiency': df_results['transportation_efficiency'].mean(),
-            'avg_inventory_health': df_results['inventory_health'].mean(),
-            'avg_roi': df_results['avg_roi'].mean()
+            'avg_resilience': mean['avg_resilience'],
+            'std_resilience': std['avg_resilience'],
+            'avg_cost': mean['avg_cost_impact'],
+            'std_cost': std['avg_cost_impact'],
+            'avg_service_level': mean['avg_service_level'],
+            'std_service_level': std['avg_service_level'],
+            'avg_recovery_time': mean['avg_recovery_time'],
+            'avg_risk_exposure': mean['avg_risk_exposure'],
+            'avg_transportation_efficiency': mean['transportation_efficiency'],
+            'avg_inventory_health': mean['inventory_health'],
+            'avg_roi': mean['avg_roi']
         }
         
         # Add region-specific supplier performance metrics
-        region_metrics = {
-            key: value for key, value in df_results.items() 
-            if key.startswith('supplier_performance_')
-        }
-        for region, values in region_metrics.items():
-            stats[f'avg_{region}'] = values.mean()
+        stats.update({f'avg_{column}': mean[column] for column in self._supplier_cols})
+        
+        return stats, (self.plot_results(summary) if plot else {})
+        
+    def _summarize_results(self) -> pd.DataFrame:
+        """
+        Mean and standard deviation of the core and supplier metrics in a single
+        aggregation, shared with the plot helpers so no column is reduced twice
+        """
+        return self.df_results[CORE_METRIC_COLUMNS + self._supplier_cols].agg(['mean', 'std'])
+        
+    def plot_results(self, summary: Optional[pd.DataFrame] = None) -> Dict[str, plt.Figure]:
+        """
+        Generate, save and store the result figures
+        
+        Args:
+            summary: Result of _summarize_results, computed if not given
+        
+        Returns:
+            Dict[str, plt.Figure]: Generated figures by name
+        """
+        df_results = self.df_results
+        if summary is None:
+            summary = self._summarize_results()
         
-        # Generate and store figures
         self.figures['hypothesis_validation'] = self._plot_hypothesis_validation(df_results)
-        self.figures['overall_benefits'] = self._plot_overall_benefits(df_results)
-        self.figures['domain_impact'] = self._plot_domain_impact(df_results)
-        self.figures['total_time'] = self._plot_total_time_analysis(df_results)
+        self.figures['overall_benefits'] = self._plot_overall_benefits(df_results, summary)
+        self.figures['domain_impact'] = self._plot_domain_impact(df_results, summary)
+        self.figures['total_time'] = self._plot_total_time_analysis(df_results, summary)
         
-        return stats, self.figures
+        return self.figures
         
     def _plot_hypothesis_validation(self, df_results: pd.DataFrame) -> plt.Figure:
         """Generate hypothesis validation plot"""
-        fig = plt.figure(figsize=(12, 8))
+        fig, axes = plt.subplots(2, 2, figsize=(12, 8))
         
         # Sub-hypothesis 1: Supplier Diversification
-        plt.subplot(2, 2, 1)
-        sns.scatterplot(data=df_results, x='avg_cost_impact', y='avg_resilience', alpha=0.6, label='Simulation Runs')
-        plt.title('H1: Supplier Diversification Impact')
-        plt.xlabel('Cost Impact')
-        plt.ylabel('Resilience Score')
-        plt.legend()
+        ax = axes[0, 0]
+        sns.scatterplot(data=df_results, x='avg_cost_impact', y='avg_resilience', alpha=0.6, label='Simulation Runs', ax=ax)
+        ax.set_title('H1: Supplier Diversification Impact')
+        ax.set_xlabel('Cost Impact')
+        ax.set_ylabel('Resilience Score')
+        ax.legend()
         
         # Sub-hypothesis 2: Inventory Management
-        plt.subplot(2, 2, 2)
-        sns.lineplot(data=df_results, x=range(len(df_results)), y='avg_service_level', label='Service Level')
-        plt.title('H2: Dynamic Inventory Effectiveness')
-        plt.xlabel('Simulation Run')
-        plt.ylabel('Service Level')
-        plt.legend()
+        ax = axes[0, 1]
+        sns.lineplot(data=df_results, x=df_results.index, y='avg_service_level', label='Service Level', ax=ax)
+        ax.set_title('H2: Dynamic Inventory Effectiveness')
+        ax.set_xlabel('Simulation Run')
+        ax.set_ylabel('Service Level')
+        ax.legend()
         
         # Sub-hypothesis 3: Transportation Flexibility
-        plt.subplot(2, 2, 3)
-        sns.histplot(data=df_results, x='avg_recovery_time', bins=30, label='Recovery Time')
-        plt.title('H3: Transportation Route Flexibility')
-        plt.xlabel('Recovery Time (weeks)')
-        plt.ylabel('Frequency')
-        plt.legend()
+        ax = axes[1, 0]
+        sns.histplot(data=df_results, x='avg_recovery_time', bins=30, label='Recovery Time', ax=ax)
+        ax.set_title('H3: Transportation Route Flexibility')
+        ax.set_xlabel('Recovery Time (weeks)')
+        ax.set_ylabel('Frequency')
+        ax.legend()
         
         # Sub-hypothesis 4: Regional Production
-        plt.subplot(2, 2, 4)
+        ax = axes[1, 1]
         metrics_map = {
             'avg_resilience': 'Resilience',
             'avg_service_level': 'Service Level',
             'avg_cost_impact': 'Cost Impact'
         }
-        df_melted = pd.melt(df_results[['avg_resilience', 'avg_service_level', 'avg_cost_impact']])
-        df_melted['variable'] = df_melted['variable'].map(metrics_map)
-        sns.boxplot(data=df_melted, x='variable', y='value')
-        plt.title('H4: Regional Production Performance')
-        plt.xticks(rotation=45)
+        ax.boxplot([df_results[metric].to_numpy() for metric in metrics_map])
+        ax.set_xticks(range(1, len(metrics_map) + 1))
+        ax.set_xticklabels(metrics_map.values(), rotation=45)
+        ax.set_title('H4: Regional Production Performance')
         
-        plt.tight_layout()
-        plt.savefig(f'simulation_results/{self.timestamp}_experimental_hypothesis_validation.png')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self._out_prefix}hypothesis_validation.png', dpi=100)
+        plt.close(fig)
         
         return fig
     
-    def _plot_overall_benefits(self, df_results: pd.DataFrame) -> plt.Figure:
+    def _plot_overall_benefits(self, df_results: pd.DataFrame, summary: pd.DataFrame) -> plt.Figure:
         """Generate overall benefits plot"""
-        fig = plt.figure(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6))
         
         # ROI Distribution
-        sns.histplot(data=df_results, x='avg_roi', bins=30, label='ROI Distribution')
-        mean_roi = df_results['avg_roi'].mean()
-        plt.axvline(x=mean_roi, color='r', linestyle='--', 
+        sns.histplot(data=df_results, x='avg_roi', bins=30, label='ROI Distribution', ax=ax)
+        mean_roi = summary.at['mean', 'avg_roi']
+        ax.axvline(x=mean_roi, color='r', linestyle='--', 
                    label=f'Mean ROI: {mean_roi:.2f}')
         
-        plt.title('Distribution of Return on Resilience Investment')
-        plt.xlabel('ROI')
-        plt.ylabel('Frequency')
-        plt.legend()
+        ax.set_title('Distribution of Return on Resilience Investment')
+        ax.set_xlabel('ROI')
+        ax.set_ylabel('Frequency')
+        ax.legend()
         
-        plt.tight_layout()
-        plt.savefig(f'simulation_results/{self.timestamp}_experimental_overall_benefits.png')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self._out_prefix}overall_benefits.png', dpi=100)
+        plt.close(fig)
         
         return fig
     
-    def _plot_domain_impact(self, df_results: pd.DataFrame) -> plt.Figure:
+    def _plot_domain_impact(self, df_results: pd.DataFrame, summary: pd.DataFrame) -> plt.Figure:
         """Generate domain impact plot"""
-        fig = plt.figure(figsize=(15, 10))
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         
         # Supplier Performance
-        plt.subplot(2, 2, 1)
-        supplier_data = pd.DataFrame({
-            region: df_results[f'supplier_performance_{region}'].mean()
-            for region in self.config['regions'].keys()
-        }, index=[0]).melt()
-        sns.barplot(data=supplier_data, x='variable', y='value')
-        plt.title('Regional Supplier Performance')
-        plt.xlabel('Region')
-        plt.ylabel('Performance Score')
-        plt.xticks(rotation=45)
+        ax = axes[0, 0]
+        ax.bar(self._region_names, summary.loc['mean', self._supplier_cols].to_numpy())
+        ax.set_title('Regional Supplier Performance')
+        ax.set_xlabel('Region')
+        ax.set_ylabel('Performance Score')
+        ax.tick_params(axis='x', labelrotation=45)
         
         # Risk Exposure Over Time
-        plt.subplot(2, 2, 2)
-        sns.lineplot(data=df_results, x=range(len(df_results)), 
-                    y='avg_risk_exposure', label='Risk Level')
-        plt.title('Risk Exposure Trend')
-        plt.xlabel('Simulation Run')
-        plt.ylabel('Risk Level')
-        plt.legend()
+        ax = axes[0, 1]
+        sns.lineplot(data=df_results, x=df_results.index, 
+                    y='avg_risk_exposure', label='Risk Level', ax=ax)
+        ax.set_title('Risk Exposure Trend')
+        ax.set_xlabel('Simulation Run')
+        ax.set_ylabel('Risk Level')
+        ax.legend()
         
         # Transportation Efficiency
-        plt.subplot(2, 2, 3)
+        ax = axes[1, 0]
         sns.histplot(data=df_results, x='transportation_efficiency', 
-                    bins=30, label='Efficiency Distribution')
-        plt.axvline(x=df_results['transportation_efficiency'].mean(), 
+                    bins=30, label='Efficiency Distribution', ax=ax)
+        mean_efficiency = summary.at['mean', 'transportation_efficiency']
+        ax.axvline(x=mean_efficiency, 
                    color='r', linestyle='--', 
-                   label=f'Mean: {df_results["transportation_efficiency"].mean():.2f}')
-        plt.title('Transportation Network Efficiency')
-        plt.xlabel('Efficiency Score')
-        plt.ylabel('Frequency')
-        plt.legend()
+                   label=f'Mean: {mean_efficiency:.2f}')
+        ax.set_title('Transportation Network Efficiency')
+        ax.set_xlabel('Efficiency Score')
+        ax.set_ylabel('Frequency')
+        ax.legend()
         
         # Inventory Health
-        plt.subplot(2, 2, 4)
+        ax = axes[1, 1]
         metrics = ['inventory_health', 'avg_service_level']
-        df_melted = pd.melt(df_results[metrics])
-        sns.boxplot(data=df_melted, x='variable', y='value')
-        plt.title('Inventory Health vs Service Level')
-        plt.ylabel('Score')
-        plt.xticks(rotation=45)
+        ax.boxplot(df_results[metrics].to_numpy())
+        ax.set_xticks(range(1, len(metrics) + 1))
+        ax.set_xticklabels(metrics, rotation=45)
+        ax.set_title('Inventory Health vs Service Level')
+        ax.set_ylabel('Score')
         
-        plt.tight_layout()
-        plt.savefig(f'simulation_results/{self.timestamp}_experimental_domain_impact.png')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(f'{self._out_prefix}domain_impact.png', dpi=100)
+        plt.close(fig)
         
         return fig
     
-    def _plot_total_time_analysis(self, df_results: pd.DataFrame) -> plt.Figure:
+    def _plot_total_time_analysis(self, df_results: pd.DataFrame, summary: pd.DataFrame) -> plt.Figure:
         """Generate total time analysis plot"""
-        fig = plt.figure(figsize=(15, 10))
+        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
         
         # Recovery Time Distribution
-        plt.subplot(2, 2, 1)
+        ax = axes[0, 0]
         sns.histplot(data=df_results, x='avg_recovery_time', 
-                    bins=30, label='Recovery Time')
-        plt.axvline(x=df_results['avg_recovery_time'].mean(), 
+                    bins=30, label='Recovery Time', ax=ax)
+        mean_recovery = summary.at['mean', 'avg_recovery_time']
+        ax.axvline(x=mean_recovery, 
                    color='r', linestyle='--', 
-                   label=f'Mean: {df_results["avg_recovery_time"].mean():.1f} weeks')
-        plt.title('Distribution of Recovery Times')
-        plt.xlabel('Weeks')
-        plt.ylabel('Frequency')
-        plt.legend()
+                   label=f'Mean: {mean_recovery:.1f} weeks')
+        ax.set_title('Distribution of Recovery Times')
+        ax.set_xlabel('Weeks')
+        ax.set_ylabel('Frequency')
+        ax.legend()
         
         # Service Level Over Time
-        plt.subplot(2, 2, 2)
-        mean_service = df_results['avg_service_level'].mean()
-        std_service = df_results['avg_service_level'].std()
-        sns.lineplot(data=df_results, x=range(len(df_results)), 
-                    y='avg_service_level', label='Service Level')
-        plt.fill_between(range(len(df_results)), 
+        ax = axes[0, 1]
+        mean_service = summary.at['mean', 'avg_service_level']
+        std_service = summary.at['std', 'avg_service_level']
+        sns.lineplot(data=df_results, x=df_results.index, 
+                    y='avg_service_level', label='Service Level', ax=ax)
+        ax.fill_between(df_results.index.to_numpy(), 
                         df_results['avg_service_level'] - std_service,
                         df_results['avg_service_level'] + std_service,
                         alpha=0.3, label=f'±1 STD ({std_service:.2f})')
-        plt.title(f'Service Level Stability (Mean: {mean_service:.2f})')
-        plt.xlabel('Simulation Run')
-        plt.ylabel('Service Level')
-        plt.legend()
+        ax.set_title(f'Service Level Stability (Mean: {mean_service:.2f})')
+        ax.set_xlabel('Simulation Run')
+        ax.set_ylabel('Service Level')
+        ax.legend()
         
         # Cost Impact Timeline
-        plt.subplot(2, 2, 3)
-        sns.lineplot(data=df_results, x=range(len(df_results)), 
-                    y='avg_cost_impact', label='Cost Impact')
-        plt.title('Cost Impact Evolution')
-        plt.xlabel('Simulation Run')
-        plt.ylabel('Cost Impact')
-        plt.legend()
+        ax = axes[1, 0]
+        sns.lineplot(data=df_results, x=df_results.index, 
+                    y='avg_cost_impact', label='Cost Impact', ax=ax)
+        ax.set_title('Cost Impact Evolution')
+        ax.set_xlabel('Simulation Run')
+        ax.set_ylabel('Cost Impact')
+        ax.legend()
         
         # Resilience Score Timeline
-        plt.subplot(2, 2, 4)
-        sns.lineplot(data=df_results, x=range(len(df_results)), 
-                    y='avg_resilience', label='Resilience Score')
-        plt.title('Resilience Score Evolution')
-        plt.xlabel('Simulation Run')
-        plt.ylabel('Resilience Score')
-        plt.legend()
-        
-        plt.tight_layout()
-        plt.savefig(f'simulation_results/{self.timestamp}_experimental_total_time.png')
-        plt.close()
+        ax = axes[1, 1]
+        sns.lineplot(data=df_results, x=df_results.index, 
+                    y='avg_resilience', label='Resilience Score', ax=ax)
+        ax.set_title('Resilience Score Evolution')
+        ax.set_xlabel('Simulation Run')
+        ax.set_ylabel('Resilience Score')
+        ax.legend()
+        
+        fig.tight_layout()
+        fig.savefig(f'{self._out_prefix}total_time.png', dpi=100)
+        plt.close(fig)
         
         return fig
         
+# Simulation reused by every iteration a worker process runs, set by _init_worker
+_worker_simulation: Optional[MonteCarloSimulation] = None
+
+def _init_worker(config: Dict[str, Any], scenario_name: str) -> None:
+    """Create the per-process simulation whose world and agents are reused across iterations"""
+    global _worker_simulation
+    _worker_simulation = MonteCarloSimulation(config, scenario_name, max_workers=1)
+
+def _run_one_iteration(args: Tuple[int, np.random.SeedSequence]) -> Dict[str, float]:
+    """
+    Run a single Monte Carlo iteration in a worker process
+    
+    Args:
+        args: (iteration, seed) tuple
+    
+    Returns:
+        Dict[str, float]: Metrics summary for the iteration
+    """
+    iteration, seed = args
+    return _worker_simulation._run_seeded_iteration(iteration, seed)
+
+def _run_scenario(args: Tuple[str, Dict[str, Any], Optional[int]]) -> Tuple[str, pd.DataFrame, Dict[str, float]]:
+    """
+    Run and analyze a single scenario in a worker process
+    
+    Args:
+        args: (scenario_name, config, max_workers) tuple, max_workers sizing the iteration pool
+    
+    Returns:
+        Tuple[str, pd.DataFrame, Dict[str, float]]: (scenario name, iteration results, statistics)
+    """
+    scenario_name, config, max_workers = args
+    simulation = MonteCarloSimulation(config, scenario_name, max_workers=max_workers)
+    results = simulation.run()
+    
+    # Figures are saved to disk by analyze_results; only the statistics travel back
+    scenario_stats, _ = simulation.analyze_results()
+    return scenario_name, results, scenario_stats
+
 def run_all_scenarios():
     """Run simulations for all scenarios and generate comparative analysis"""
     scenarios = {
@@ -438,29 +598,36 @@ def run_all_scenarios():
         'multi_factor_disruption': ScenarioConfig.get_multi_factor_disruption_config()
     }
     
-    all_results = []
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     # Create output directory
     output_dir = f'test_results/{timestamp}'
     os.makedirs(output_dir, exist_ok=True)
     
-    # Run simulations for each scenario
-    for scenario_name, config in scenarios.items():
-        print(f"\nRunning scenario: {scenario_name}")
-        simulation = MonteCarloSimulation(config, scenario_name)
-        simulation.run()
-        
-        # Analyze individual scenario results
-        scenario_stats, scenario_figures = simulation.analyze_results()
-        print(f"\nScenario {scenario_name} Statistics:")
-        for metric, value in scenario_stats.items():
-            print(f"{metric}: {value:.3f}")
-            
-        all_results.extend(simulation.results)
-    
-    # Convert results to DataFrame for comparative analysis
-    df_results = pd.DataFrame(all_results)
+    # Run scenarios concurrently, splitting the CPUs between scenario and iteration pools
+    cpu_count = os.cpu_count() or 1
+    scenario_workers = min(len(scenarios), cpu_count)
+    iteration_workers = max(1, cpu_count // scenario_workers)
+    
+    scenario_results = {}
+    with ProcessPoolExecutor(max_workers=scenario_workers) as executor:
+        futures = []
+        for scenario_name, config in scenarios.items():
+            print(f"\nRunning scenario: {scenario_name}")
+            futures.append(executor.submit(_run_scenario, (scenario_name, config, iteration_workers)))
+        
+        for future in as_completed(futures):
+            scenario_name, results, scenario_stats = future.result()
+            print(f"\nScenario {scenario_name} Statistics:")
+            for metric, value in scenario_stats.items():
+                print(f"{metric}: {value:.3f}")
+            scenario_results[scenario_name] = results
+    
+    # Combine results in scenario order regardless of completion order
+    df_results = pd.concat([scenario_results[scenario_name] for scenario_name in scenarios],
+                           ignore_index=True)
+    # Concatenating single-category columns yields object dtype; restore one shared categorical
+    df_results['scenario'] = pd.Categorical(df_results['scenario'], categories=list(scenarios))
     
     # Generate comparative visualizations
     plot_scenario_comparisons(df_results, timestamp)
@@ -472,134 +639,157 @@ def run_all_scenarios():
 
 def plot_scenario_comparisons(df_results: pd.DataFrame, timestamp: str):
     """Generate comparative visualizations for different scenarios"""
-    plt.figure(figsize=(15, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
     # Core metrics comparison
-    plt.subplot(2, 2, 1)
+    ax = axes[0, 0]
     metrics = ['avg_resilience', 'avg_service_level', 'avg_cost_impact']
     metric_labels = {'avg_resilience': 'Resilience', 
                     'avg_service_level': 'Service Level', 
                     'avg_cost_impact': 'Cost Impact'}
-    df_melted = pd.melt(df_results, id_vars=['scenario'], value_vars=metrics)
-    df_melted['variable'] = df_melted['variable'].map(metric_labels)
-    sns.boxplot(data=df_melted, x='variable', y='value', hue='scenario')
-    plt.title('Core Metrics by Scenario')
-    plt.xticks(rotation=45)
-    plt.legend(title='Scenario', bbox_to_anchor=(1.05, 1), loc='upper left')
+    # One group of boxes per metric, one box per scenario within the group
+    scenarios = list(df_results['scenario'].unique())
+    colors = sns.color_palette(n_colors=len(scenarios))
+    width = 0.8 / len(scenarios)
+    for i, scenario in enumerate(scenarios):
+        ax.boxplot(df_results.loc[df_results['scenario'] == scenario, metrics].to_numpy(),
+                   positions=np.arange(len(metrics)) - 0.4 + width * (i + 0.5),
+                   widths=width * 0.9, patch_artist=True,
+                   boxprops={'facecolor': colors[i]}, medianprops={'color': 'black'},
+                   manage_ticks=False)
+    ax.set_xticks(np.arange(len(metrics)))
+    ax.set_xticklabels([metric_labels[metric] for metric in metrics], rotation=45)
+    ax.set_title('Core Metrics by Scenario')
+    ax.legend(handles=[Patch(facecolor=color, label=scenario) for scenario, color in zip(scenarios, colors)],
+              title='Scenario', bbox_to_anchor=(1.05, 1), loc='upper left')
     
     # Recovery time comparison
-    plt.subplot(2, 2, 2)
-    sns.boxplot(data=df_results, x='scenario', y='avg_recovery_time')
-    plt.title('Recovery Time by Scenario')
-    plt.xlabel('Scenario')
-    plt.ylabel('Recovery Time (weeks)')
-    plt.xticks(rotation=45)
+    ax = axes[0, 1]
+    sns.boxplot(data=df_results, x='scenario', y='avg_recovery_time', ax=ax)
+    ax.set_title('Recovery Time by Scenario')
+    ax.set_xlabel('Scenario')
+    ax.set_ylabel('Recovery Time (weeks)')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Risk exposure comparison
-    plt.subplot(2, 2, 3)
-    sns.boxplot(data=df_results, x='scenario', y='avg_risk_exposure')
-    plt.title('Risk Exposure by Scenario')
-    plt.xlabel('Scenario')
-    plt.ylabel('Risk Level')
-    plt.xticks(rotation=45)
+    ax = axes[1, 0]
+    sns.boxplot(data=df_results, x='scenario', y='avg_risk_exposure', ax=ax)
+    ax.set_title('Risk Exposure by Scenario')
+    ax.set_xlabel('Scenario')
+    ax.set_ylabel('Risk Level')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # ROI comparison
-    plt.subplot(2, 2, 4)
-    sns.boxplot(data=df_results, x='scenario', y='avg_roi')
-    plt.title('ROI by Scenario')
-    plt.xlabel('Scenario')
-    plt.ylabel('Return on Investment')
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    plt.savefig(f'simulation_results/scenario_comparison_{timestamp}.png', bbox_inches='tight')
-    plt.close()
+    ax = axes[1, 1]
+    sns.boxplot(data=df_results, x='scenario', y='avg_roi', ax=ax)
+    ax.set_title('ROI by Scenario')
+    ax.set_xlabel('Scenario')
+    ax.set_ylabel('Return on Investment')
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    fig.tight_layout()
+    fig.savefig(f'simulation_results/scenario_comparison_{timestamp}.png', bbox_inches='tight', dpi=100)
+    plt.close(fig)
 
-def plot_strategy_effectiveness(df_results: pd.DataFrame, timestamp: str):
-    """Analyze effectiveness of different strategies"""
-    plt.figure(figsize=(15, 10))
+def plot_strategy_effectiveness(df_results: pd.DataFrame, timestamp: str,
+                                supplier_columns: Optional[List[str]] = None):
+    """
+    Analyze effectiveness of different strategies
+    
+    Args:
+        df_results: Combined results of all scenarios
+        timestamp: Timestamp used in the output file name
+        supplier_columns: supplier_performance_* columns to compare; defaults to the
+                          regions of DEFAULT_CONFIG
+    """
+    if supplier_columns is None:
+        supplier_columns = [f'supplier_performance_{region}' for region in DEFAULT_CONFIG['regions']]
+    
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
     # Strategy effectiveness in different scenarios
-    plt.subplot(2, 2, 1)
+    ax = axes[0, 0]
     strategy_metrics = ['transportation_efficiency', 'inventory_health']
     df_melted = pd.melt(df_results, id_vars=['scenario'], value_vars=strategy_metrics)
-    sns.boxplot(data=df_melted, x='scenario', y='value', hue='variable')
-    plt.title('Strategy Effectiveness by Scenario')
-    plt.xticks(rotation=45)
+    sns.boxplot(data=df_melted, x='scenario', y='value', hue='variable', ax=ax)
+    ax.set_title('Strategy Effectiveness by Scenario')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Regional performance comparison
-    plt.subplot(2, 2, 2)
-    regional_cols = [col for col in df_results.columns if 'supplier_performance_' in col]
-    df_melted = pd.melt(df_results, id_vars=['scenario'], value_vars=regional_cols)
-    sns.boxplot(data=df_melted, x='scenario', y='value', hue='variable')
-    plt.title('Regional Performance by Scenario')
-    plt.xticks(rotation=45)
+    ax = axes[0, 1]
+    df_melted = pd.melt(df_results, id_vars=['scenario'], value_vars=supplier_columns)
+    sns.boxplot(data=df_melted, x='scenario', y='value', hue='variable', ax=ax)
+    ax.set_title('Regional Performance by Scenario')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Cost vs. Resilience trade-off
-    plt.subplot(2, 2, 3)
+    ax = axes[1, 0]
     for scenario in df_results['scenario'].unique():
         scenario_data = df_results[df_results['scenario'] == scenario]
-        plt.scatter(scenario_data['avg_cost_impact'], scenario_data['avg_resilience'], 
-                   label=scenario, alpha=0.6)
-    plt.title('Cost vs. Resilience Trade-off')
-    plt.xlabel('Cost Impact')
-    plt.ylabel('Resilience Score')
-    plt.legend()
+        ax.scatter(scenario_data['avg_cost_impact'], scenario_data['avg_resilience'], 
+                  label=scenario, alpha=0.6)
+    ax.set_title('Cost vs. Resilience Trade-off')
+    ax.set_xlabel('Cost Impact')
+    ax.set_ylabel('Resilience Score')
+    ax.legend()
     
     # Service level stability
-    plt.subplot(2, 2, 4)
-    sns.boxplot(data=df_results, x='scenario', y='avg_service_level')
-    plt.title('Service Level Stability')
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    plt.savefig(f'simulation_results/strategy_effectiveness_{timestamp}.png')
-    plt.close()
+    ax = axes[1, 1]
+    sns.boxplot(data=df_results, x='scenario', y='avg_service_level', ax=ax)
+    ax.set_title('Service Level Stability')
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    fig.tight_layout()
+    fig.savefig(f'simulation_results/strategy_effectiveness_{timestamp}.png', dpi=100)
+    plt.close(fig)
 
 def plot_disruption_impact_analysis(df_results: pd.DataFrame, timestamp: str):
     """Analyze impact of different types of disruptions"""
-    plt.figure(figsize=(15, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     
     # Recovery time vs. disruption type
-    plt.subplot(2, 2, 1)
-    sns.boxplot(data=df_results, x='scenario', y='avg_recovery_time')
-    plt.title('Recovery Time by Disruption Type')
-    plt.xticks(rotation=45)
+    ax = axes[0, 0]
+    sns.boxplot(data=df_results, x='scenario', y='avg_recovery_time', ax=ax)
+    ax.set_title('Recovery Time by Disruption Type')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Cost impact vs. disruption type
-    plt.subplot(2, 2, 2)
-    sns.boxplot(data=df_results, x='scenario', y='avg_cost_impact')
-    plt.title('Cost Impact by Disruption Type')
-    plt.xticks(rotation=45)
+    ax = axes[0, 1]
+    sns.boxplot(data=df_results, x='scenario', y='avg_cost_impact', ax=ax)
+    ax.set_title('Cost Impact by Disruption Type')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Service level impact
-    plt.subplot(2, 2, 3)
-    sns.boxplot(data=df_results, x='scenario', y='avg_service_level')
-    plt.title('Service Level Impact')
-    plt.xticks(rotation=45)
+    ax = axes[1, 0]
+    sns.boxplot(data=df_results, x='scenario', y='avg_service_level', ax=ax)
+    ax.set_title('Service Level Impact')
+    ax.tick_params(axis='x', labelrotation=45)
     
     # Risk exposure comparison
-    plt.subplot(2, 2, 4)
-    sns.boxplot(data=df_results, x='scenario', y='avg_risk_exposure')
-    plt.title('Risk Exposure by Disruption Type')
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    plt.savefig(f'simulation_results/disruption_impact_{timestamp}.png')
-    plt.close()
+    ax = axes[1, 1]
+    sns.boxplot(data=df_results, x='scenario', y='avg_risk_exposure', ax=ax)
+    ax.set_title('Risk Exposure by Disruption Type')
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    fig.tight_layout()
+    fig.savefig(f'simulation_results/disruption_impact_{timestamp}.png', dpi=100)
+    plt.close(fig)
 
 def print_scenario_summaries(df_results: pd.DataFrame):
     """Print summary statistics for each scenario"""
     print("\nScenario Analysis Summary:")
-    for scenario in df_results['scenario'].unique():
-        scenario_data = df_results[df_results['scenario'] == scenario]
+    # Mean and standard deviation of every metric for every scenario in one grouped pass
+    metrics = ['avg_resilience', 'avg_service_level', 'avg_cost_impact',
+               'avg_recovery_time', 'avg_risk_exposure', 'avg_roi']
+    summary = df_results.groupby('scenario', sort=False, observed=True)[metrics].agg(['mean', 'std'])
+    for scenario, row in summary.iterrows():
         print(f"\n{scenario.upper()}:")
-        print(f"Resilience Score: {scenario_data['avg_resilience'].mean():.3f} (±{scenario_data['avg_resilience'].std():.3f})")
-        print(f"Service Level: {scenario_data['avg_service_level'].mean():.3f} (±{scenario_data['avg_service_level'].std():.3f})")
-        print(f"Cost Impact: {scenario_data['avg_cost_impact'].mean():.3f} (±{scenario_data['avg_cost_impact'].std():.3f})")
-        print(f"Recovery Time: {scenario_data['avg_recovery_time'].mean():.1f} weeks")
-        print(f"Risk Exposure: {scenario_data['avg_risk_exposure'].mean():.3f}")
-        print(f"ROI: {scenario_data['avg_roi'].mean():.3f}")
+        print(f"Resilience Score: {row['avg_resilience', 'mean']:.3f} (±{row['avg_resilience', 'std']:.3f})")
+        print(f"Service Level: {row['avg_service_level', 'mean']:.3f} (±{row['avg_service_level', 'std']:.3f})")
+        print(f"Cost Impact: {row['avg_cost_impact', 'mean']:.3f} (±{row['avg_cost_impact', 'std']:.3f})")
+        print(f"Recovery Time: {row['avg_recovery_time', 'mean']:.1f} weeks")
+        print(f"Risk Exposure: {row['avg_risk_exposure', 'mean']:.3f}")
+        print(f"ROI: {row['avg_roi', 'mean']:.3f}")
 
 def create_styled_stats_df(all_stats: Dict[str, Dict[str, float]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
@@ -614,18 +804,16 @@ def create_styled_stats_df(all_stats: Dict[str, Dict[str, float]]) -> Tuple[pd.D
             - pct_change_df: DataFrame with percentage changes from baseline
     """
     # Create DataFrame with actual values
-    values_df = pd.DataFrame(all_stats).round(3)
-    
+    stats_df = pd.DataFrame(all_stats)
+    values_df = stats_df.round(3)
+
     # Calculate percentage changes from baseline if baseline exists
     pct_change_df = pd.DataFrame()
     if 'baseline' in all_stats:
-        baseline_stats = pd.Series(all_stats['baseline'])
-        for scenario in all_stats:
-            if scenario != 'baseline':
-                scenario_stats = pd.Series(all_stats[scenario])
-                pct_change = ((scenario_stats - baseline_stats) / baseline_stats * 100)
-                pct_change_df[scenario] = pct_change
-    
+        # Subtract and divide by the baseline column across all scenarios at once, aligned on metric
+        baseline = stats_df['baseline']
+        pct_change_df = stats_df.drop(columns='baseline').sub(baseline, axis=0).div(baseline, axis=0) * 100
+
     return values_df, pct_change_df
 
 def main():
@@ -5,11 +5,154 @@ This module provides utilities for managing simulation scenarios and configurati
 It allows listing available scenarios, creating custom scenarios, and validating configurations.
 """
 
-from typing import Dict, Any, List
-from copy import deepcopy
+from typing import Dict, Any, List, Union, Mapping
 import json
+import numpy as np
 
-from supply_chain_config import DEFAULT_CONFIG
+from supply_chain_config import DEFAULT_CONFIG, DEFAULT_CONFIG_RO, _freeze
+
+# Keys checked by ScenarioManager.validate_config
+_NUMERIC = (int, float)
+_REQUIRED_SECTIONS = ('simulation', 'regions', 'coo', 'regional_manager', 'supplier')
+_SIM_INT_KEYS = ('monte_carlo_iterations', 'simulation_length_weeks', 'seed')
+_REG_NUM_KEYS = ('disaster_probability', 'infrastructure_quality')
+
+# Frozen scenario configurations built so far, keyed by scenario name
+_SCENARIO_CACHE: Dict[str, Mapping[str, Any]] = {'baseline': DEFAULT_CONFIG_RO}
+
+# Per-region parameter multipliers applied by each predefined scenario. A number applies
+# to every region; a dict maps region names to factors, with '*' covering all other regions.
+SCENARIO_MULTIPLIERS: Dict[str, Dict[str, Union[float, Dict[str, float]]]] = {
+    'baseline': {},
+    'supplier_disruption': {
+        'disaster_probability': 2
+    },
+    'transportation_disruption': {
+        'infrastructure_quality': 0.7
+    },
+    'production_disruption': {
+        'production_capacity': 0.6,
+        'disaster_probability': 1.5
+    },
+    'multi_factor_disruption': {
+        'disaster_probability': 1.8,
+        'infrastructure_quality': 0.8,
+        'production_capacity': 0.7
+    },
+    'global_tariff_disruption': {
+        # East Asia (China): increased trade tensions, 30% tariff cost increase,
+        # customs and border delays, higher disruption risk
+        # Other regions: 10% global cost increase, increased supply chain uncertainty,
+        # minor logistics slowdown
+        'political_stability': {'East_Asia': 0.8, '*': 1.0},
+        'labor_cost': {'East_Asia': 1.3, '*': 1.1},
+        'infrastructure_quality': {'East_Asia': 0.9, '*': 0.95},
+        'disaster_probability': {'East_Asia': 1.4, '*': 1.2}
+    }
+}
+
+# Parameters that can be edited in the UI, with their metadata
+_EDITABLE_PARAMETERS: Mapping[str, Mapping[str, Any]] = _freeze({
+    'simulation': {
+        'monte_carlo_iterations': {
+            'type': 'int',
+            'min': 10,
+            'max': 10000,
+            'default': 100,
+            'description': 'Number of simulation iterations'
+        },
+        'simulation_length_weeks': {
+            'type': 'int',
+            'min': 1,
+            'max': 520,
+            'default': 52,
+            'description': 'Length of each simulation run in weeks'
+        },
+        'seed': {
+            'type': 'int',
+            'min': 0,
+            'max': 999999,
+            'default': 42,
+            'description': 'Random seed for reproducibility'
+        }
+    },
+    'regions': {
+        'disaster_probability': {
+            'type': 'float',
+            'min': 0.0,
+            'max': 1.0,
+            'default': 0.1,
+            'description': 'Probability of disasters in each region'
+        },
+        'infrastructure_quality': {
+            'type': 'float',
+            'min': 0.0,
+            'max': 1.0,
+            'default': 0.9,
+            'description': 'Quality of infrastructure (0-1)'
+        },
+        'production_capacity': {
+            'type': 'float',
+            'min': 0.0,
+            'max': 1.0,
+            'default': 0.7,
+            'description': 'Production capacity utilization (0-1)'
+        }
+    },
+    'agent': {
+        'decision_making_speed': {
+            'type': 'float',
+            'min': 0.0,
+            'max': 1.0,
+            'default': 0.8,
+            'description': 'Agent decision-making speed (0-1)'
+        },
+        'risk_tolerance': {
+            'type': 'float',
+            'min': 0.0,
+            'max': 1.0,
+            'default': 0.6,
+            'description': 'Agent risk tolerance (0-1)'
+        }
+    }
+})
+
+def _apply_region_multipliers(regions: Dict[str, Dict[str, Any]],
+                              multipliers: Dict[str, Union[float, Dict[str, float]]]) -> None:
+    """
+    Scale regional parameters in place with one (regions x parameters) elementwise product
+    
+    Missing parameters are treated as 1.0 before scaling, as for production_capacity.
+    """
+    if not multipliers:
+        return
+    names = list(regions)
+    params = list(multipliers)
+    values = np.array([[regions[name].get(param, 1.0) for param in params] for name in names])
+    factors = np.array([
+        [
+            multipliers[param].get(name, multipliers[param]['*']) if isinstance(multipliers[param], dict)
+            else multipliers[param]
+            for param in params
+        ]
+        for name in names
+    ])
+    for name, row in zip(names, (values * factors).tolist()):
+        regions[name].update(zip(params, row))
+
+def _clone_config(value: Any) -> Any:
+    """
+    Deep-copy a configuration tree made of dicts, lists and immutable scalars
+    
+    Faster than copy.deepcopy for this JSON-shaped data since it skips the memo
+    bookkeeping and per-object copy protocol dispatch. Frozen trees (mappings and
+    tuples, see supply_chain_config._freeze) come back as plain dicts and lists.
+    """
+    if isinstance(value, Mapping):
+        return {key: _clone_config(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clone_config(item) for item in value]
+    return value
 
 class ScenarioManager:
     """Manages simulation scenarios and configurations"""
@@ -36,131 +179,85 @@ class ScenarioManager:
         """
         Get configuration for a specific scenario
         
+        Each scenario is built once and cached; callers receive their own copy.
+        
         Args:
             scenario_name: Name of the scenario
             
         Returns:
             Dict[str, Any]: Configuration dictionary for the scenario
         """
-        config = deepcopy(DEFAULT_CONFIG)
+        return _clone_config(ScenarioManager.get_scenario_config_readonly(scenario_name))
+    
+    @staticmethod
+    def get_scenario_config_readonly(scenario_name: str) -> Mapping[str, Any]:
+        """
+        Get the cached configuration for a specific scenario without copying it
         
-        if scenario_name == 'baseline':
-            return config
+        The returned configuration is shared and frozen: mappings are read-only
+        proxies and lists are tuples. The baseline is DEFAULT_CONFIG_RO itself.
         
-        elif scenario_name == 'supplier_disruption':
-            for region in config['regions'].values():
-                region['disaster_probability'] *= 2
-            
-        elif scenario_name == 'transportation_disruption':
-            for region in config['regions'].values():
-                region['infrastructure_quality'] *= 0.7
-            
-        elif scenario_name == 'production_disruption':
-            for region in config['regions'].values():
-                region['production_capacity'] = region.get('production_capacity', 1.0) * 0.6
-                region['disaster_probability'] *= 1.5
-            
-        elif scenario_name == 'multi_factor_disruption':
-            for region in config['regions'].values():
-                region['disaster_probability'] *= 1.8
-                region['infrastructure_quality'] *= 0.8
-                region['production_capacity'] = region.get('production_capacity', 1.0) * 0.7
-
-        elif scenario_name == 'global_tariff_disruption':
-            # East Asia (China) specific impacts
-            config['regions']['East_Asia']['political_stability'] *= 0.8  # Increased trade tensions
-            config['regions']['East_Asia']['labor_cost'] *= 1.3  # 30% cost increase due to tariffs
-            config['regions']['East_Asia']['infrastructure_quality'] *= 0.9  # Customs and border delays
-            config['regions']['East_Asia']['disaster_probability'] *= 1.4  # Higher disruption risk
+        Args:
+            scenario_name: Name of the scenario
             
-            # Global ripple effects
-            for region in config['regions'].values():
-                if region != config['regions']['East_Asia']:
-                    region['labor_cost'] *= 1.1  # 10% global cost increase
-                    region['disaster_probability'] *= 1.2  # Increased global supply chain uncertainty
-                    region['infrastructure_quality'] *= 0.95  # Minor logistics slowdown
+        Returns:
+            Mapping[str, Any]: Read-only configuration for the scenario
+        """
+        if scenario_name not in _SCENARIO_CACHE:
+            _SCENARIO_CACHE[scenario_name] = _freeze(ScenarioManager._build_scenario_config(scenario_name))
+        return _SCENARIO_CACHE[scenario_name]
+    
+    @staticmethod
+    def get_scenario_multipliers(scenario_name: str) -> Dict[str, Dict[str, float]]:
+        """
+        Get the per-region parameter multipliers a scenario applies to DEFAULT_CONFIG
+        
+        Args:
+            scenario_name: Name of the scenario
             
-            # Adjust resilience strategy costs due to market complexity
-            config['resilience_strategies']['supplier_diversification']['cost_impact'] *= 1.2
-            config['resilience_strategies']['transportation_flexibility']['cost_impact'] *= 1.15
+        Returns:
+            Dict[str, Dict[str, float]]: Mapping of region name to {parameter: factor}
+        """
+        if scenario_name not in SCENARIO_MULTIPLIERS:
+            raise ValueError(f"Unknown scenario: {scenario_name}")
         
-        else:
+        multipliers = SCENARIO_MULTIPLIERS[scenario_name]
+        return {
+            region_name: {
+                param: factor.get(region_name, factor['*']) if isinstance(factor, dict) else factor
+                for param, factor in multipliers.items()
+            }
+            for region_name in DEFAULT_CONFIG['regions']
+        }
+    
+    @staticmethod
+    def _build_scenario_config(scenario_name: str) -> Dict[str, Any]:
+        """Build the configuration for a specific scenario from DEFAULT_CONFIG"""
+        if scenario_name not in SCENARIO_MULTIPLIERS:
             raise ValueError(f"Unknown scenario: {scenario_name}")
         
+        config = _clone_config(DEFAULT_CONFIG)
+        _apply_region_multipliers(config['regions'], SCENARIO_MULTIPLIERS[scenario_name])
+        
+        if scenario_name == 'global_tariff_disruption':
+            # Adjust resilience strategy costs due to market complexity
+            strategies = config['resilience_strategies']
+            strategies['supplier_diversification']['cost_impact'] *= 1.2
+            strategies['transportation_flexibility']['cost_impact'] *= 1.15
+        
         return config
     
     @staticmethod
-    def get_editable_parameters() -> Dict[str, Dict[str, Any]]:
+    def get_editable_parameters() -> Mapping[str, Mapping[str, Any]]:
         """
         Get list of parameters that can be edited in the UI
         
+        The table is built once at import and shared read-only between callers.
+        
         Returns:
-            Dict[str, Dict[str, Any]]: Dictionary of parameter metadata
+            Mapping[str, Mapping[str, Any]]: Dictionary of parameter metadata
         """
-        return {
-            'simulation': {
-                'monte_carlo_iterations': {
-                    'type': 'int',
-                    'min': 10,
-                    'max': 10000,
-                    'default': 100,
-                    'description': 'Number of simulation iterations'
-                },
-                'simulation_length_weeks': {
-                    'type': 'int',
-                    'min': 1,
-                    'max': 520,
-                    'default': 52,
-                    'description': 'Length of each simulation run in weeks'
-                },
-                'seed': {
-                    'type': 'int',
-                    'min': 0,
-                    'max': 999999,
-                    'default': 42,
-                    'description': 'Random seed for reproducibility'
-                }
-            },
-            'regions': {
-                'disaster_probability': {
-                    'type': 'float',
-                    'min': 0.0,
-                    'max': 1.0,
-                    'default': 0.1,
-                    'description': 'Probability of disasters in each region'
-                },
-                'infrastructure_quality': {
-                    'type': 'float',
-                    'min': 0.0,
-                    'max': 1.0,
-                    'default': 0.9,
-                    'description': 'Quality of infrastructure (0-1)'
-                },
-                'production_capacity': {
-                    'type': 'float',
-                    'min': 0.0,
-                    'max': 1.0,
-                    'default': 0.7,
-                    'description': 'Production capacity utilization (0-1)'
-                }
-            },
-            'agent': {
-                'decision_making_speed': {
-                    'type': 'float',
-                    'min': 0.0,
-                    'max': 1.0,
-                    'default': 0.8,
-                    'description': 'Agent decision-making speed (0-1)'
-                },
-                'risk_tolerance': {
-                    'type': 'float',
-                    'min': 0.0,
-                    'max': 1.0,
-                    'default': 0.6,
-                    'description': 'Agent risk tolerance (0-1)'
-                }
-            }
-        }
+        return _EDITABLE_PARAMETERS
     
     @staticmethod
     def create_custom_config(base_scenario: str, parameter_updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -183,26 +280,21 @@ class ScenarioManager:
         
         # Update regional parameters while preserving scenario-specific modifications
         if 'regions' in parameter_updates:
-            # Store the scenario's modification factors
-            modification_factors = {}
-            if base_scenario != 'baseline':
-                base_config = deepcopy(DEFAULT_CONFIG)
-                for region_name, region in config['regions'].items():
-                    modification_factors[region_name] = {
-                        param: region[param] / base_config['regions'][region_name][param]
-                        for param in region.keys()
-                        if param in base_config['regions'][region_name]
-                    }
+            # The scenario's modification factors, looked up rather than re-derived from the values
+            modification_factors = ScenarioManager.get_scenario_multipliers(base_scenario)
             
             # Apply custom parameters while preserving scenario modifications
             for region_name, region_params in parameter_updates['regions'].items():
                 if region_name in config['regions']:
+                    base_region = DEFAULT_CONFIG['regions'].get(region_name, {})
+                    factors = modification_factors.get(region_name, {})
                     for param, value in region_params.items():
                         if param in config['regions'][region_name]:
-                            if base_scenario != 'baseline' and param in modification_factors.get(region_name, {}):
+                            if param in factors and param in base_region:
                                 # Apply both the custom value and the scenario's modification factor
-                                config['regions'][region_name][param] = value * modification_factors[region_name][param]
+                                config['regions'][region_name][param] = value * factors[param]
                             else:
+                                # Parameters the scenario adds (e.g. production_capacity) have no base value to scale
                                 config['regions'][region_name][param] = value
         
         # Update agent parameters
@@ -226,20 +318,21 @@ class ScenarioManager:
         """
         try:
             # Check required sections
-            required_sections = ['simulation', 'regions', 'coo', 'regional_manager', 'supplier']
-            for section in required_sections:
+            for section in _REQUIRED_SECTIONS:
                 if section not in config:
                     return False
             
-            # Check simulation parameters
+            # Check simulation parameters (exact type checks, stopping at the first failure)
             sim_params = config['simulation']
-            if not all(isinstance(sim_params.get(p), int) for p in ['monte_carlo_iterations', 'simulation_length_weeks', 'seed']):
-                return False
+            for key in _SIM_INT_KEYS:
+                if type(sim_params.get(key)) is not int:
+                    return False
             
             # Check regional parameters
             for region in config['regions'].values():
-                if not all(isinstance(region.get(p), (int, float)) for p in ['disaster_probability', 'infrastructure_quality']):
-                    return False
+                for key in _REG_NUM_KEYS:
+                    if type(region.get(key)) not in _NUMERIC:
+                        return False
             
             return True
             
@@ -26,9 +26,71 @@ The agents use TinyTroupe's cognitive architecture to:
 from tinytroupe.agent.tiny_person import TinyPerson
 from tinytroupe.agent.memory import SemanticMemory, EpisodicMemory, TinyMemory
 from tinytroupe.agent.mental_faculty import TinyMentalFaculty
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple, Callable
 import numpy as np
 
+# Number of uniform random numbers each agent draws at once for its faculties
+RANDOM_BUFFER_SIZE = 256
+
+def _clamp01(value: float) -> float:
+    """Clamp a score to [0, 1] with plain comparisons (cheaper than max(0.0, min(1.0, x)))"""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+def _adjust_decision_score(base_score: float, speed_factor: float, tolerance_factor: float) -> float:
+    """Scale a base score by an agent's precomputed decision factors and clamp it to [0, 1]"""
+    return _clamp01(base_score * speed_factor * tolerance_factor)
+
+def _adjust_risk(base_risk: float, risk_factor: float) -> float:
+    """Scale a base risk by an agent's precomputed risk factor and clamp it to [0, 1]"""
+    return _clamp01(base_risk * risk_factor)
+
+def _disruption_arrays(disruptions: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract severity and probability arrays (defaulting to 0.5) from disruption dicts"""
+    count = len(disruptions)
+    severity = np.fromiter((d.get('severity', 0.5) for d in disruptions), dtype=np.float64, count=count)
+    probability = np.fromiter((d.get('probability', 0.5) for d in disruptions), dtype=np.float64, count=count)
+    return severity, probability
+
+def _regional_manager_decisions(risk_level: Any, infrastructure_quality: Any, decide: Callable[[Any], Any]) -> Dict[str, Any]:
+    """
+    Decision rules of a regional manager, shared by the per-agent and batched paths
+    
+    Works on scalars for one agent or on arrays with one entry per agent.
+    
+    Args:
+        risk_level: Assessed risk of the agent's regional disruptions
+        infrastructure_quality: Quality of the agent's regional infrastructure
+        decide: Decision-making faculty scoring, applied to each base score
+        
+    Returns:
+        Dict[str, Any]: Decision values by name
+    """
+    return {
+        'local_inventory_level': decide(risk_level) * 0.7,
+        'supplier_coordination': decide(infrastructure_quality) * 0.8,
+        'contingency_activation': np.where(risk_level > 0.7, 1.0, 0.0)
+    }
+
+def _supplier_decisions(infrastructure_quality: Any, disruptions: Any, decide: Callable[[Any], Any]) -> Dict[str, Any]:
+    """
+    Decision rules of a supplier, shared by the per-agent and batched paths
+    
+    Works on scalars for one agent or on arrays with one entry per agent.
+    
+    Args:
+        infrastructure_quality: Quality of the agent's regional infrastructure
+        disruptions: The agent's regional disruptions, or their mean severities when batched
+        decide: Decision-making faculty scoring, applied to each base score
+        
+    Returns:
+        Dict[str, Any]: Decision values by name
+    """
+    return {
+        'production_rate': decide(infrastructure_quality) * 0.9,
+        'quality_control': np.full(np.shape(infrastructure_quality), 0.8),  # Maintain high quality standards
+        'delivery_schedule': decide(disruptions) * 0.7
+    }
+
 class SupplyChainMentalFaculty(TinyMentalFaculty):
     """
     Base class for supply chain mental faculties
@@ -44,6 +106,8 @@ class SupplyChainMentalFaculty(TinyMentalFaculty):
     0.5: Neutral/uncertain assessment
     1.0: Completely positive/favorable assessment
     """
+    __slots__ = ('agent',)  # Owning SupplyChainAgent, set after construction
+    
     def process(self, input_data: Any) -> float:
         """Process input data and return a score between 0 and 1"""
         return 0.5  # Default implementation
@@ -60,36 +124,29 @@ class DecisionMakingFaculty(SupplyChainMentalFaculty):
     - Strategic objectives
     """
     def process(self, input_data: Dict[str, Any]) -> float:
-        # Get agent parameters from semantic memory
-        capabilities_memory = next(
-            (m for m in self.agent.semantic_memory.memories if m.get('type') == 'capabilities'),
-            None
-        )
-        if not capabilities_memory or 'content' not in capabilities_memory:
-            return np.random.random()  # Fallback to random if no capabilities found
-            
-        capabilities = capabilities_memory['content']
-        decision_speed = capabilities.get('decision_making_speed', 0.8)
-        risk_tolerance = capabilities.get('risk_tolerance', 0.6)
+        # Get agent parameters cached from semantic memory
+        if self.agent._capabilities is None:
+            return self.agent._next_random()  # Fallback to random if no capabilities found
         
         # Calculate base score from input data
         if isinstance(input_data, (int, float)):
             base_score = float(input_data)
         elif isinstance(input_data, (list, tuple)):
             # For lists (e.g., disruptions), use the average severity
-            severities = [d.get('severity', 0.5) for d in input_data if isinstance(d, dict)]
-            base_score = np.mean(severities) if severities else 0.5
+            disruptions = [d for d in input_data if isinstance(d, dict)]
+            base_score = float(_disruption_arrays(disruptions)[0].mean()) if disruptions else 0.5
         else:
             base_score = 0.5
         
-        # Adjust score based on agent parameters
+        # Adjust score based on agent parameters and keep it within [0, 1]
         # Higher decision speed means more extreme decisions
         # Higher risk tolerance means more aggressive decisions
-        adjusted_score = base_score * (1 + (decision_speed - 0.5) * 0.4)
-        adjusted_score = adjusted_score * (1 + (risk_tolerance - 0.5) * 0.3)
-        
-        # Ensure score stays within [0, 1]
-        return max(0.0, min(1.0, adjusted_score))
+        return _adjust_decision_score(base_score, self.agent._speed_factor, self.agent._tolerance_factor)
+
+    @staticmethod
+    def process_batch(base_scores: np.ndarray, speed_factor: np.ndarray, tolerance_factor: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of process() for arrays of base scores and the agents' precomputed factors"""
+        return np.clip(base_scores * speed_factor * tolerance_factor, 0.0, 1.0)
 
 class RiskAssessmentFaculty(SupplyChainMentalFaculty):
     """
@@ -102,44 +159,38 @@ class RiskAssessmentFaculty(SupplyChainMentalFaculty):
     - Environmental conditions
     """
     def process(self, input_data: Any) -> float:
-        # Get agent parameters from semantic memory
-        capabilities_memory = next(
-            (m for m in self.agent.semantic_memory.memories if m.get('type') == 'capabilities'),
-            None
-        )
-        if not capabilities_memory or 'content' not in capabilities_memory:
-            return np.random.random()  # Fallback to random if no capabilities found
-            
-        capabilities = capabilities_memory['content']
-        risk_tolerance = capabilities.get('risk_tolerance', 0.6)
+        # Get agent parameters cached from semantic memory
+        if self.agent._capabilities is None:
+            return self.agent._next_random()  # Fallback to random if no capabilities found
         
         # Calculate base risk score
         if isinstance(input_data, (list, tuple)):
             # For lists of disruptions, calculate aggregate risk
-            risk_scores = []
-            for disruption in input_data:
-                if isinstance(disruption, dict):
-                    severity = disruption.get('severity', 0.5)
-                    probability = disruption.get('probability', 0.5)
-                    risk_scores.append(severity * probability)
-            base_risk = np.mean(risk_scores) if risk_scores else 0.5
+            disruptions = [d for d in input_data if isinstance(d, dict)]
+            if disruptions:
+                severity, probability = _disruption_arrays(disruptions)
+                base_risk = float((severity * probability).mean())
+            else:
+                base_risk = 0.5
         elif isinstance(input_data, (int, float)):
             base_risk = float(input_data)
         else:
             base_risk = 0.5
         
-        # Adjust risk assessment based on risk tolerance
+        # Adjust risk assessment based on risk tolerance and keep it within [0, 1]
         # Lower risk tolerance means higher perceived risk
-        adjusted_risk = base_risk * (1.5 - risk_tolerance)
-        
-        # Ensure score stays within [0, 1]
-        return max(0.0, min(1.0, adjusted_risk))
+        return _adjust_risk(base_risk, self.agent._risk_factor)
+
+    @staticmethod
+    def process_batch(base_risks: np.ndarray, risk_factor: np.ndarray) -> np.ndarray:
+        """Vectorized equivalent of process() for arrays of base risks and the agents' precomputed risk factors"""
+        return np.clip(base_risks * risk_factor, 0.0, 1.0)
 
 class StrategicPlanningFaculty(SupplyChainMentalFaculty):
     """Mental faculty for strategic planning"""
     def process(self, input_data: Any) -> float:
         # Simple implementation - return a random score
-        return np.random.random()
+        return self.agent._next_random()
 
 class SupplyChainSemanticMemory(TinyMemory):
     """
@@ -161,24 +212,56 @@ class SupplyChainSemanticMemory(TinyMemory):
        - Regional characteristics
        - Risk factors
     """
+    __slots__ = ('memories', '_by_type')
+    
     def __init__(self):
         super().__init__("Supply Chain Memory")
         self.memories = []
+        self._by_type: Dict[str, List[Any]] = {}  # Memories indexed by their 'type' field
     
     def _store(self, value: Any) -> None:
         """Store a value in memory"""
         self.memories.append(value)
+        memory_type = value.get('type', '_') if isinstance(value, dict) else '_'
+        self._by_type.setdefault(memory_type, []).append(value)
+    
+    def get_by_type(self, memory_type: str) -> List[Any]:
+        """Return all memories of the given type, in storage order"""
+        return self._by_type.get(memory_type, [])
     
     def retrieve_relevant(self, relevance_target: str, top_k: int = 20) -> list:
         """Retrieve relevant memories"""
-        # Simple implementation - return all memories
+        # Memory types are matched directly through the index; any other target returns all memories
+        if relevance_target in self._by_type:
+            return self._by_type[relevance_target]
         return self.memories
 
+# Decision method used for each agent role; other roles make no decisions
+_DECISION_FNS = {
+    'COO': '_make_coo_decision',
+    'Regional_Manager': '_make_regional_manager_decision',
+    'Supplier': '_make_supplier_decision'
+}
+
 class SupplyChainAgent(TinyPerson):
-    def __init__(self, name: str, role: str, region: str = None, config: Dict[str, Any] = None):
+    # Attributes read in the decision loop live in slots rather than the instance __dict__
+    __slots__ = (
+        'role', 'region', 'rng', '_random_buffer', '_random_index',
+        'semantic_memory', 'episodic_memory',
+        'decision_making', 'risk_assessment', 'strategic_planning',
+        '_capabilities', '_decision_speed', '_risk_tolerance',
+        '_speed_factor', '_tolerance_factor', '_risk_factor', '_decision_fn'
+    )
+    
+    def __init__(self, name: str, role: str, region: str = None, config: Dict[str, Any] = None,
+                 rng: np.random.Generator = None):
         super().__init__(name)
         self.role = role
         self.region = region
+        self._decision_fn = getattr(self, _DECISION_FNS.get(role, '_noop_decision'))  # Role dispatch resolved once
+        self.rng = np.random.default_rng(rng)  # Random number generator used by the mental faculties; replaced on reset
+        self._random_buffer = np.empty(RANDOM_BUFFER_SIZE)  # Pre-drawn uniforms served by _next_random
+        self._random_index = RANDOM_BUFFER_SIZE  # Buffer starts exhausted; filled on first use
         
         # Initialize semantic memory with role-specific knowledge
         self.semantic_memory = SupplyChainSemanticMemory()
@@ -217,6 +300,12 @@ class SupplyChainAgent(TinyPerson):
         }
         self.semantic_memory.store(base_knowledge)
         
+        # Capabilities never change after initialization, so the faculties read them
+        # from these attributes instead of scanning semantic memory on every decision
+        self._capabilities: Optional[Dict[str, Any]] = None
+        self._decision_speed = 0.8
+        self._risk_tolerance = 0.6
+        
         # Store agent capabilities
         if config:
             capabilities = {
@@ -230,6 +319,14 @@ class SupplyChainAgent(TinyPerson):
                 }
             }
             self.semantic_memory.store(capabilities)
+            self._capabilities = capabilities['content']
+            self._decision_speed = self._capabilities['decision_making_speed']
+            self._risk_tolerance = self._capabilities['risk_tolerance']
+        
+        # Score multipliers derived from the capabilities, used by the faculties on every decision
+        self._speed_factor = 1 + (self._decision_speed - 0.5) * 0.4
+        self._tolerance_factor = 1 + (self._risk_tolerance - 0.5) * 0.3
+        self._risk_factor = 1.5 - self._risk_tolerance
         
         role_specific_knowledge = {
             "COO": {
@@ -277,14 +374,41 @@ class SupplyChainAgent(TinyPerson):
         if self.role in role_specific_knowledge:
             self.semantic_memory.store(role_specific_knowledge[self.role])
                 
+    def reset(self, rng: np.random.Generator = None) -> None:
+        """
+        Forget experiences from a previous iteration so the agent can be reused
+        
+        Semantic memory and mental faculties depend only on the configuration and are kept.
+        
+        Args:
+            rng: Generator for the next iteration, usually shared with the world
+        """
+        self.episodic_memory = EpisodicMemory()
+        self.rng = np.random.default_rng(rng)
+        self._random_index = RANDOM_BUFFER_SIZE  # Discard numbers drawn from the previous generator
+        
+    def _next_random(self) -> float:
+        """Return the next uniform [0, 1) number, refilling the buffer from self.rng in one call when empty"""
+        if self._random_index >= RANDOM_BUFFER_SIZE:
+            self.rng.random(out=self._random_buffer)
+            self._random_index = 0
+        value = self._random_buffer[self._random_index]
+        self._random_index += 1
+        return float(value)
+        
     def perceive_environment(self, env) -> Dict[str, Any]:
         """Process environmental information and store in episodic memory"""
+        if self.region:
+            # Regional agents only act on their own region's disruptions, already bucketed by the world
+            disruptions = list(env.disruptions_by_time_region.get((env.current_time, self.region), ()))
+        else:
+            disruptions = list(env.current_disruptions)  # This week's events, collected once by the world
         perception = {
             'type': 'stimulus',
             'simulation_timestamp': env.current_time,
             'content': {
                 'time': env.current_time,
-                'disruptions': [d for d in env.disruption_events if d['time'] == env.current_time],
+                'disruptions': disruptions,
                 'region_status': env.regions[self.region] if self.region else env.regions
             }
         }
@@ -293,16 +417,92 @@ class SupplyChainAgent(TinyPerson):
         self.episodic_memory.store(perception)
         return perception
         
+    def _record_action(self, perception: Dict[str, Any], decisions: Dict[str, Any]) -> None:
+        """Store the decisions taken for a perception as an action in episodic memory"""
+        self.episodic_memory.store({
+            'type': 'action',
+            'simulation_timestamp': perception['simulation_timestamp'],
+            'content': {
+                'decision': decisions,
+                'context': perception['content']
+            }
+        })
+        
+    @classmethod
+    def batch_perceive(cls, agents: List['SupplyChainAgent'], env) -> Dict['SupplyChainAgent', Dict[str, Any]]:
+        """
+        Perceive the environment for several agents
+        
+        Returns:
+            Dict[SupplyChainAgent, Dict[str, Any]]: Perception of each agent, keyed by agent
+        """
+        return {agent: agent.perceive_environment(env) for agent in agents}
+        
+    @classmethod
+    def make_decisions_batch(cls, agents: List['SupplyChainAgent'], env) -> List[Dict[str, Any]]:
+        """
+        Make decisions for several agents in one pass
+        
+        Regional managers and suppliers are scored together: their regional features are
+        stacked into (agents, features) arrays and the faculty arithmetic is applied with
+        NumPy broadcasting. Other agents fall back to make_decision.
+        
+        Returns:
+            List[Dict[str, Any]]: Decisions for each agent, in the order given
+        """
+        decisions: List[Dict[str, Any]] = [None] * len(agents)
+        batches: Dict[str, List[int]] = {'Regional_Manager': [], 'Supplier': []}
+        for i, agent in enumerate(agents):
+            if agent.role in batches and agent.region and agent._capabilities is not None:
+                batches[agent.role].append(i)
+            else:
+                decisions[i] = agent.make_decision(env)
+        
+        for role, indices in batches.items():
+            if not indices:
+                continue
+            group = [agents[i] for i in indices]
+            perceptions = list(cls.batch_perceive(group, env).values())
+            
+            # Feature columns: infrastructure quality, the agent's precomputed speed, tolerance
+            # and risk factors, mean local severity, mean local severity x probability
+            features = np.empty((len(group), 6))
+            for row, (agent, perception) in enumerate(zip(group, perceptions)):
+                local_disruptions = perception['content']['disruptions']  # Already limited to the agent's region
+                features[row, 0] = perception['content']['region_status']['infrastructure_quality']
+                features[row, 1] = agent._speed_factor
+                features[row, 2] = agent._tolerance_factor
+                features[row, 3] = agent._risk_factor
+                if local_disruptions:
+                    local_severity, local_probability = _disruption_arrays(local_disruptions)
+                    features[row, 4] = local_severity.mean()
+                    features[row, 5] = (local_severity * local_probability).mean()
+                else:
+                    features[row, 4:6] = 0.5
+            infrastructure, speed_factor, tolerance_factor, risk_factor, severity, risk = features.T
+            
+            def decide(base_scores: np.ndarray) -> np.ndarray:
+                return DecisionMakingFaculty.process_batch(base_scores, speed_factor, tolerance_factor)
+            
+            if role == 'Regional_Manager':
+                risk_level = RiskAssessmentFaculty.process_batch(risk, risk_factor)
+                columns = _regional_manager_decisions(risk_level, infrastructure, decide)
+            else:
+                columns = _supplier_decisions(infrastructure, severity, decide)
+            
+            for row, (i, agent, perception) in enumerate(zip(indices, group, perceptions)):
+                agent_decisions = {name: float(values[row]) for name, values in columns.items()}
+                agent._record_action(perception, agent_decisions)
+                decisions[i] = agent_decisions
+        
+        return decisions
+        
     def make_decision(self, env) -> Dict[str, Any]:
         """Make decisions based on current perception and memories"""
-        perception = self.perceive_environment(env)
-        
-        if self.role == "COO":
-            return self._make_coo_decision(perception)
-        elif self.role == "Regional_Manager":
-            return self._make_regional_manager_decision(perception)
-        elif self.role == "Supplier":
-            return self._make_supplier_decision(perception)
+        return self._decision_fn(self.perceive_environment(env))
+        
+    def _noop_decision(self, perception: Dict[str, Any]) -> Dict[str, Any]:
+        """Decision for roles without decision logic: no actions"""
         return {}
         
     def _make_coo_decision(self, perception: Dict[str, Any]) -> Dict[str, Any]:
@@ -318,14 +518,7 @@ class SupplyChainAgent(TinyPerson):
         }
         
         # Store decision in episodic memory
-        self.episodic_memory.store({
-            'type': 'action',
-            'simulation_timestamp': perception['simulation_timestamp'],
-            'content': {
-                'decision': decisions,
-                'context': perception['content']
-            }
-        })
+        self._record_action(perception, decisions)
         
         return decisions
         
@@ -335,25 +528,16 @@ class SupplyChainAgent(TinyPerson):
             return {}
             
         region_status = perception['content']['region_status']
-        risk_level = self.risk_assessment.process([
-            d for d in perception['content']['disruptions'] 
-            if d['region'] == self.region
-        ])
+        risk_level = self.risk_assessment.process(perception['content']['disruptions'])  # Already local to the region
         
         decisions = {
-            'local_inventory_level': self.decision_making.process(risk_level) * 0.7,
-            'supplier_coordination': self.decision_making.process(region_status['infrastructure_quality']) * 0.8,
-            'contingency_activation': 1.0 if risk_level > 0.7 else 0.0
+            name: float(value)
+            for name, value in _regional_manager_decisions(
+                risk_level, region_status['infrastructure_quality'], self.decision_making.process
+            ).items()
         }
         
-        self.episodic_memory.store({
-            'type': 'action',
-            'simulation_timestamp': perception['simulation_timestamp'],
-            'content': {
-                'decision': decisions,
-                'context': perception['content']
-            }
-        })
+        self._record_action(perception, decisions)
         
         return decisions
         
@@ -363,25 +547,16 @@ class SupplyChainAgent(TinyPerson):
             return {}
             
         region_status = perception['content']['region_status']
-        local_disruptions = [
-            d for d in perception['content']['disruptions']
-            if d['region'] == self.region
-        ]
+        local_disruptions = perception['content']['disruptions']  # Already local to the region
         
         decisions = {
-            'production_rate': self.decision_making.process(region_status['infrastructure_quality']) * 0.9,
-            'quality_control': 0.8,  # Maintain high quality standards
-            'delivery_schedule': self.decision_making.process(local_disruptions) * 0.7
+            name: float(value)
+            for name, value in _supplier_decisions(
+                region_status['infrastructure_quality'], local_disruptions, self.decision_making.process
+            ).items()
         }
         
-        self.episodic_memory.store({
-            'type': 'action',
-            'simulation_timestamp': perception['simulation_timestamp'],
-            'content': {
-                'decision': decisions,
-                'context': perception['content']
-            }
-        })
+        self._record_action(perception, decisions)
         
         return decisions
 
@@ -11,8 +11,13 @@ Configuration Structure:
 3. Regional Parameters: Model different geographical markets
 4. Resilience Strategies: Define available risk mitigation approaches
 5. Performance Metrics: Specify how to measure supply chain effectiveness
+
+DEFAULT_CONFIG_RO is a frozen snapshot (a separate copy) of that data for consumers that only read it.
 """
 
+from types import MappingProxyType
+from typing import Any
+
 DEFAULT_CONFIG = {
     'simulation': {
         # Monte Carlo parameters based on statistical significance requirements
@@ -113,4 +118,15 @@ DEFAULT_CONFIG = {
         },
         'service_level_target': 0.95           # Industry standard service level
     }
-} 
\ No newline at end of file
+}
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in MappingProxyType and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Read-only copy of DEFAULT_CONFIG that can be shared without defensive copies
+DEFAULT_CONFIG_RO = _freeze(DEFAULT_CONFIG)
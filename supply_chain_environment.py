@@ -11,18 +11,254 @@ The metrics and calculations are based on real-world supply chain management pri
 and academic research in supply chain resilience.
 """
 
+from collections import defaultdict
+from functools import wraps
 from tinytroupe.environment.tiny_world import TinyWorld
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union, Callable
 import numpy as np
 from supply_chain_config import DEFAULT_CONFIG
 
+# Strategic moves a competitor can make in a region
+COMPETITOR_ACTION_TYPES = ('price_cut', 'capacity_increase', 'new_supplier')
+
+def _clamp01(value: float) -> float:
+    """Clamp a metric to [0, 1] with plain comparisons"""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
+
+# Region indices and severities of a week without disruptions
+_NO_DISRUPTIONS = (np.empty(0, dtype=np.intp), np.empty(0))
+
+class MetricHistory:
+    """
+    Append-only history of one metric, stored in a preallocated float64 buffer
+    
+    Keeps a running sum, minimum and maximum so summaries do not rescan the history.
+    Supports the list operations the world uses (append, clear, len, indexing, iteration).
+    """
+    def __init__(self, capacity: int):
+        self._buffer = np.empty(max(1, capacity))
+        self._size = 0
+        self._sum = 0.0
+        self._min = float('inf')
+        self._max = float('-inf')
+        
+    def append(self, value: float) -> None:
+        """Add a value, doubling the buffer when it is full"""
+        if self._size == len(self._buffer):
+            self._buffer = np.concatenate([self._buffer, np.empty(len(self._buffer))])
+        value = float(value)
+        self._buffer[self._size] = value
+        self._size += 1
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+            
+    def clear(self) -> None:
+        """Drop all values, keeping the buffer"""
+        self._size = 0
+        self._sum = 0.0
+        self._min = float('inf')
+        self._max = float('-inf')
+        
+    @property
+    def values(self) -> np.ndarray:
+        """The recorded values, as a view of the buffer"""
+        return self._buffer[:self._size]
+        
+    def mean(self) -> float:
+        """Mean of the recorded values (nan when empty)"""
+        return self._sum / self._size if self._size else float('nan')
+        
+    def min(self) -> float:
+        """Smallest recorded value (inf when empty)"""
+        return self._min
+        
+    def max(self) -> float:
+        """Largest recorded value (-inf when empty)"""
+        return self._max
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def __getitem__(self, index):
+        return self.values[index]
+        
+    def __iter__(self):
+        return iter(self.values.tolist())
+        
+    def __array__(self, dtype=None, copy=None):
+        return self.values if dtype is None else self.values.astype(dtype)
+
+class DisruptionLog:
+    """
+    Append-only disruption history, stored as parallel preallocated arrays
+    
+    One entry per event: week, region index, disruption type id and severity. The
+    world keeps dicts only for the current week; events() rebuilds dicts for the
+    whole history on demand.
+    """
+    def __init__(self, capacity: int):
+        capacity = max(1, capacity)
+        self._time = np.empty(capacity, dtype=np.int32)
+        self._region = np.empty(capacity, dtype=np.int8)
+        self._type = np.empty(capacity, dtype=np.int8)
+        self._severity = np.empty(capacity)
+        self._size = 0
+        
+    def extend(self, time: int, region_indices: np.ndarray, type_ids: np.ndarray, severities: np.ndarray) -> None:
+        """Add one week's events, doubling the buffers when they are full"""
+        start, end = self._size, self._size + len(region_indices)
+        if end > len(self._time):
+            capacity = max(end, 2 * len(self._time))
+            self._time, self._region, self._type, self._severity = (
+                np.concatenate([buffer, np.empty(capacity - len(buffer), dtype=buffer.dtype)])
+                for buffer in (self._time, self._region, self._type, self._severity)
+            )
+        self._time[start:end] = time
+        self._region[start:end] = region_indices
+        self._type[start:end] = type_ids
+        self._severity[start:end] = severities
+        self._size = end
+        
+    def clear(self) -> None:
+        """Drop all events, keeping the buffers"""
+        self._size = 0
+        
+    def events(self, region_names: Tuple[str, ...], type_names: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """
+        Rebuild the history as event dicts
+        
+        Args:
+            region_names: Region name for each region index
+            type_names: Disruption type name for each type id
+            
+        Returns:
+            List[Dict[str, Any]]: One {'time', 'region', 'type', 'severity'} dict per event, oldest first
+        """
+        n = self._size
+        return [
+            {'time': time, 'region': region_names[region], 'type': type_names[type_id], 'severity': severity}
+            for time, region, type_id, severity in zip(
+                self._time[:n].tolist(), self._region[:n].tolist(),
+                self._type[:n].tolist(), self._severity[:n].tolist()
+            )
+        ]
+        
+    def __len__(self) -> int:
+        return self._size
+
+def _cached_per_step(method: Callable) -> Callable:
+    """
+    Memoize a metric calculation for the current step
+    
+    Only for metrics that depend on nothing step() changes after the disruptions are
+    generated (not service level, inventory health or resilience, which feed each other).
+    Results for the world's own state are kept in self._step_cache, cleared every step;
+    calls with any other state dict are computed directly.
+    """
+    name = method.__name__
+    
+    @wraps(method)
+    def wrapper(self, state: Dict[str, Any]):
+        if state is not self.state:
+            return method(self, state)
+        cache = self._step_cache
+        if name not in cache:
+            cache[name] = method(self, state)
+        return cache[name]
+    
+    return wrapper
+
+def _regional_performance_kernel(infrastructure_quality: np.ndarray, political_stability: np.ndarray,
+                                 disruption_severity: np.ndarray, gdp_growth: np.ndarray,
+                                 inflation_rate: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute supplier and regional performance for all regions at once
+    
+    The single implementation behind _calculate_supplier_performance and
+    _calculate_regional_performance; every argument is an array with one entry per region.
+    
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Supplier performance and regional performance per region
+    """
+    # Disruption impact is halved to model supplier resilience; economic health is GDP growth minus inflation
+    supplier_performance = np.clip(
+        infrastructure_quality - disruption_severity / 2 + (gdp_growth - inflation_rate), 0.0, 1.0
+    )
+    regional_performance = (
+        0.4 * supplier_performance +
+        0.3 * infrastructure_quality +
+        0.3 * political_stability
+    )
+    return supplier_performance, regional_performance
+
 class SupplyChainWorld(TinyWorld):
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(name="Supply Chain World")
         self.config = config or DEFAULT_CONFIG
         self.current_time = 0
-        self.disruption_events = []
+        # Per-week views; only the current week is ever read, so they are rebuilt every step
+        self.disruptions_by_time_region: Dict[Tuple[int, str], List[Dict[str, Any]]] = defaultdict(list)  # Current week's events by (time, region)
+        self.current_disruptions: List[Dict[str, Any]] = []  # Current week's events
+        self._current_disruption_arrays: Tuple[np.ndarray, np.ndarray] = _NO_DISRUPTIONS  # Packed (region index, severity)
+        self._step_cache: Dict[str, Any] = {}  # Metric results for the current step, see _cached_per_step
+        self._metrics_summary: Dict[str, float] = None  # Last get_metrics_summary result; dropped when metrics change
         self.regions = self.config['regions']
+        self.rng = np.random.default_rng(self.config['simulation']['seed'])  # Generator for all stochastic events; replaced on reset
+        self._random_tables: Dict[str, np.ndarray] = {}  # Pre-drawn (weeks, regions) random numbers
+        self._random_tables_start = 0  # Simulation week whose draws are in the first table row
+        self._week_draws: Dict[str, np.ndarray] = {}  # Current week's row of every table
+        
+        # Region constants as contiguous arrays (in self.regions order) for the vectorized kernels
+        self._region_index = {region: i for i, region in enumerate(self.regions)}
+        self._region_names = tuple(self.regions)
+        self._disaster_probability = np.array([r['disaster_probability'] for r in self.regions.values()])
+        self._infrastructure_quality = np.array([r['infrastructure_quality'] for r in self.regions.values()])
+        self._political_stability = np.array([r['political_stability'] for r in self.regions.values()])
+        
+        # Full disruption history for analysis; at most one event per region per week
+        self._disruption_log = DisruptionLog(
+            self.config['simulation']['simulation_length_weeks'] * len(self.regions)
+        )
+        
+        # Disruption types are drawn as integer ids into this tuple; _severity_factors[region, type]
+        # is the regional weakness that scales a disruption's base severity
+        self._disruption_types = tuple(self.config['simulation']['disruption_types'])
+        self._severity_factors = np.column_stack([
+            1 - self._political_stability if disruption_type == 'political' else 1 - self._infrastructure_quality
+            for disruption_type in self._disruption_types
+        ])
+        
+        # Loop-invariant region terms of the risk exposure and transportation efficiency metrics
+        self._base_risk_const = sum(
+            region_data['disaster_probability'] * (1 - region_data['infrastructure_quality'])
+            for region_data in self.regions.values()
+        ) / len(self.regions)
+        self._base_transport_eff_const = float(np.mean(self._infrastructure_quality))
+        
+        # Resilience strategy terms that depend only on the configured metric weights
+        cost_weights = self.config['metrics']['cost_weights']
+        resilience_weights = self.config['metrics']['resilience_weights']
+        self._strategy_cost_total = (
+            cost_weights['supplier_diversification'] * 0.4 +
+            cost_weights['inventory_management'] * 0.3 +
+            cost_weights['transportation_flexibility'] * 0.2
+        )
+        # Supplier diversification (30%): alternative sourcing speed; inventory management (40%):
+        # buffer against disruptions; transportation flexibility (30%): routing adaptability
+        self._strategy_effectiveness = (
+            resilience_weights['supplier_diversification'] * 0.3 +
+            resilience_weights['inventory_management'] * 0.4 +
+            resilience_weights['transportation_flexibility'] * 0.3
+        )
+        
+        # Economic indicators per region (same order), updated in place every step; the
+        # dicts under market_conditions['economic_indicators'] mirror them by region name
+        self._gdp_growth = np.full(len(self.regions), 0.02)
+        self._inflation_rate = np.full(len(self.regions), 0.02)
+        self._exchange_rates = np.ones(len(self.regions))
         
         # Market dynamics
         # These variables model real-world market conditions and their volatility
@@ -51,57 +287,162 @@ class SupplyChainWorld(TinyWorld):
         
         # Enhanced metrics tracking
         # Each metric is carefully chosen to represent key supply chain performance indicators
+        # Histories are sized for one entry per step of a run and grow if needed
+        weeks = self.config['simulation']['simulation_length_weeks']
         self.metrics = {
-            'resilience_score': [],    # Measures overall ability to withstand and recover from disruptions (0-1)
-            'cost_impact': [],         # Tracks financial impact of disruptions and mitigation strategies ($)
-            'service_level': [],       # Measures ability to meet customer demand (typically targeting 95-99%)
-            'roi': [],                 # Return on investment for resilience strategies (%)
-            'recovery_time': [],       # Time to return to normal operations after disruptions (weeks)
-            'risk_exposure': [],       # Aggregate measure of current risk levels (0-1)
+            'resilience_score': MetricHistory(weeks),    # Measures overall ability to withstand and recover from disruptions (0-1)
+            'cost_impact': MetricHistory(weeks),         # Tracks financial impact of disruptions and mitigation strategies ($)
+            'service_level': MetricHistory(weeks),       # Measures ability to meet customer demand (typically targeting 95-99%)
+            'roi': MetricHistory(weeks),                 # Return on investment for resilience strategies (%)
+            'recovery_time': MetricHistory(weeks),       # Time to return to normal operations after disruptions (weeks)
+            'risk_exposure': MetricHistory(weeks),       # Aggregate measure of current risk levels (0-1)
             'supplier_performance': {}, # Region-specific supplier reliability and quality metrics (0-1)
             'regional_performance': {}, # Overall regional operational effectiveness (0-1)
-            'transportation_efficiency': [], # Logistics network performance (0-1)
-            'inventory_health': []     # Balance between stockouts and holding costs (0-1)
+            'transportation_efficiency': MetricHistory(weeks), # Logistics network performance (0-1)
+            'inventory_health': MetricHistory(weeks)     # Balance between stockouts and holding costs (0-1)
         }
         
         # Initialize regional performance tracking
         for region in self.regions:
-            self.metrics['supplier_performance'][region] = []
-            self.metrics['regional_performance'][region] = []
+            self.metrics['supplier_performance'][region] = MetricHistory(weeks)
+            self.metrics['regional_performance'][region] = MetricHistory(weeks)
+        
+    def reset(self, seed: Union[int, np.random.SeedSequence, np.random.Generator] = None) -> None:
+        """
+        Return the world to its initial state so it can be reused across iterations
+        
+        Containers are cleared in place rather than reallocated, and the world gets a
+        new random number generator.
+        
+        Args:
+            seed: Seed for the new generator, or a Generator to use directly; defaults to
+                the configured simulation seed
+        """
+        if seed is None:
+            seed = self.config['simulation']['seed']
+        self.rng = np.random.default_rng(seed)
+        self._random_tables = {}
+        self._week_draws = {}
+        
+        self.current_time = 0
+        self._disruption_log.clear()
+        self.disruptions_by_time_region.clear()
+        self.current_disruptions = []
+        self._current_disruption_arrays = _NO_DISRUPTIONS
+        self._step_cache.clear()
+        self._metrics_summary = None
+        
+        self.market_conditions['price_trends'].clear()
+        self.market_conditions['competitor_actions'].clear()
+        for indicator in self.market_conditions['economic_indicators'].values():
+            indicator.clear()
+        self._gdp_growth.fill(0.02)
+        self._inflation_rate.fill(0.02)
+        self._exchange_rates.fill(1.0)
+        
+        # Drop per-step entries (e.g. service_level) so the first step sees the same state as a new world
+        self.state.clear()
+        self.state.update({
+            'time': self.current_time,
+            'regions': self.regions,
+            'disruptions': [],
+            'current_inventory': self.config['initial_inventory'],
+            'target_inventory': self.config['target_inventory'],
+            'holding_cost': self.config['base_holding_cost'],
+            'demand_volatility': self.market_conditions['demand_volatility'],
+            'metrics': {}
+        })
+        
+        for name, values in self.metrics.items():
+            if isinstance(values, dict):
+                for region_values in values.values():
+                    region_values.clear()
+            else:
+                values.clear()
         
     def step(self, action: Dict[str, Any] = None) -> Tuple[Dict[str, Any], float, bool]:
         """Advance simulation time and update world state"""
         self.current_time += 1
+        self._step_cache.clear()
+        self._metrics_summary = None
         
         # Update state with current time
         self.state['time'] = self.current_time
         
+        # Select this week's pre-drawn random numbers
+        self._load_week_draws()
+        
         # Update market and economic conditions
         self._update_market_dynamics()
         self._update_economic_indicators()
         self._generate_disruptions()
         
         # Update disruptions in state
-        self.state['disruptions'] = [d for d in self.disruption_events if d['time'] == self.current_time]
+        self.state['disruptions'] = self.current_disruptions
         
         # Calculate metrics in correct order to avoid circular dependencies
         inventory_health = self._calculate_inventory_health(self.state)
         self.state['inventory_health'] = inventory_health
-        self.metrics['inventory_health'].append(inventory_health)
         
         service_level = self._calculate_service_level(self.state)
         self.state['service_level'] = service_level
-        self.metrics['service_level'].append(service_level)
         
-        # Update all other metrics
-        self._update_metrics(self.state)
+        # Record these and all other metrics
+        self._update_metrics(self.state, service_level, inventory_health)
+        
+        # Reward high service level while penalizing high costs (cost impact is memoized for this step)
+        reward = service_level - (self._calculate_cost_impact(self.state) * 0.5)
         
-        # Calculate reward and check if simulation is done
-        reward = self._calculate_reward(self.state)
-        done = self._is_done(self.state)
+        # Check if simulation is done
+        done = self.current_time >= self.config['simulation']['max_steps']
         
         return self.state, reward, done
         
+    def _draw_random_tables(self) -> None:
+        """
+        Draw the random numbers for a whole simulation run up front
+        
+        Every stochastic event gets a (weeks, regions) table filled by one vectorized
+        generator call. Conditional draws (event type, magnitude, severity) are drawn for
+        every cell and simply go unused when the event does not occur.
+        
+        The disruption timeline of the block is derived here as well, in one vectorized
+        pass: each cell's final severity (0.0 where no disruption occurs) and each week's
+        total and maximum severity.
+        """
+        shape = (max(1, self.config['simulation']['simulation_length_weeks']), len(self.regions))
+        self._random_tables = {
+            'price_trend': self.rng.normal(1.0, self.market_conditions['demand_volatility'], shape),
+            'competitor_action': self.rng.random(shape),
+            'competitor_action_type': self.rng.integers(0, len(COMPETITOR_ACTION_TYPES), shape),  # Ids into COMPETITOR_ACTION_TYPES
+            'competitor_magnitude': self.rng.uniform(0.1, 0.5, shape),
+            'gdp_shock': self.rng.normal(0, 0.01, shape),
+            'inflation_shock': self.rng.normal(0, 0.005, shape),
+            'exchange_rate_shock': self.rng.normal(0, 0.02, shape),
+            'disruption': self.rng.random(shape),
+            'disruption_type': self.rng.integers(0, len(self._disruption_types), shape),  # Ids into _disruption_types
+            'disruption_severity': self.rng.uniform(0.1, 1.0, shape)
+        }
+        tables = self._random_tables
+        region_ids = np.arange(shape[1])
+        impact = np.where(
+            tables['disruption'] < self._disaster_probability,
+            np.clip(tables['disruption_severity'] * self._severity_factors[region_ids, tables['disruption_type']], 0.1, 1.0),
+            0.0
+        )
+        tables['disruption_impact'] = impact                      # (weeks, regions) severity, 0.0 if no disruption
+        tables['disruption_impact_total'] = impact.sum(axis=1)    # (weeks,) total severity
+        tables['disruption_impact_max'] = impact.max(axis=1)      # (weeks,) maximum severity
+        self._random_tables_start = self.current_time
+        
+    def _load_week_draws(self) -> None:
+        """Point _week_draws at the current week's rows, drawing a new block when the tables run out"""
+        row = self.current_time - self._random_tables_start
+        if not self._random_tables or row >= len(self._random_tables['disruption']):
+            self._draw_random_tables()
+            row = 0
+        self._week_draws = {name: table[row] for name, table in self._random_tables.items()}
+        
     def _update_market_dynamics(self):
         """
         Update market conditions and competitor behavior
@@ -111,18 +452,20 @@ class SupplyChainWorld(TinyWorld):
         - Competitor actions: 10% monthly probability of strategic moves, based on industry averages
         - Action magnitude: 10-50% impact, reflecting typical market share shifts
         """
-        for region in self.regions:
-            # Update price trends using normal distribution to model real market behavior
-            self.market_conditions['price_trends'][region] = np.random.normal(1.0, self.market_conditions['demand_volatility'])
-            
-            # Model competitor actions (10% probability reflects monthly strategic changes)
-            if np.random.random() < 0.1:
-                self.market_conditions['competitor_actions'].append({
-                    'time': self.current_time,
-                    'region': region,
-                    'type': np.random.choice(['price_cut', 'capacity_increase', 'new_supplier']),
-                    'magnitude': np.random.uniform(0.1, 0.5)  # 10-50% impact magnitude
-                })
+        draws = self._week_draws
+        
+        # Update price trends using normal distribution to model real market behavior
+        self.market_conditions['price_trends'].update(zip(self._region_names, draws['price_trend'].tolist()))
+        
+        # Model competitor actions (10% probability reflects monthly strategic changes);
+        # only the regions where an action occurs are visited
+        for i in np.flatnonzero(draws['competitor_action'] < 0.1).tolist():
+            self.market_conditions['competitor_actions'].append({
+                'time': self.current_time,
+                'region': self._region_names[i],
+                'type': COMPETITOR_ACTION_TYPES[draws['competitor_action_type'][i]],
+                'magnitude': draws['competitor_magnitude'][i]  # 10-50% impact magnitude
+            })
                 
     def _update_economic_indicators(self):
         """
@@ -133,65 +476,74 @@ class SupplyChainWorld(TinyWorld):
         - Inflation: 0-15% range with 0.5% monthly variation, based on global economics
         - Exchange rates: Log-normal distribution with 2% monthly volatility
         """
-        for region in self.regions:
-            # GDP growth rate changes (monthly variations around annual targets)
-            current_gdp = self.market_conditions['economic_indicators']['gdp_growth'].get(region, 0.02)
-            self.market_conditions['economic_indicators']['gdp_growth'][region] = max(-0.05, min(0.1, current_gdp + np.random.normal(0, 0.01)))
-            
-            # Inflation rate changes (based on typical central bank targets)
-            current_inflation = self.market_conditions['economic_indicators']['inflation_rate'].get(region, 0.02)
-            self.market_conditions['economic_indicators']['inflation_rate'][region] = max(0, min(0.15, current_inflation + np.random.normal(0, 0.005)))
-            
-            # Exchange rate fluctuations (log-normal to prevent negative rates)
-            current_rate = self.market_conditions['economic_indicators']['exchange_rates'].get(region, 1.0)
-            self.market_conditions['economic_indicators']['exchange_rates'][region] = max(0.5, min(2.0, current_rate * np.exp(np.random.normal(0, 0.02))))
+        draws = self._week_draws
+        
+        # GDP growth rate changes (monthly variations around annual targets)
+        np.clip(self._gdp_growth + draws['gdp_shock'], -0.05, 0.1, out=self._gdp_growth)
+        
+        # Inflation rate changes (based on typical central bank targets)
+        np.clip(self._inflation_rate + draws['inflation_shock'], 0, 0.15, out=self._inflation_rate)
+        
+        # Exchange rate fluctuations (log-normal to prevent negative rates)
+        np.clip(self._exchange_rates * np.exp(draws['exchange_rate_shock']), 0.5, 2.0, out=self._exchange_rates)
+        
+        # Keep the per-region dict views in sync
+        economic_indicators = self.market_conditions['economic_indicators']
+        economic_indicators['gdp_growth'].update(zip(self.regions, self._gdp_growth.tolist()))
+        economic_indicators['inflation_rate'].update(zip(self.regions, self._inflation_rate.tolist()))
+        economic_indicators['exchange_rates'].update(zip(self.regions, self._exchange_rates.tolist()))
             
-    def _update_metrics(self, state: Dict[str, Any]):
-        """Update all performance metrics"""
+    def _update_metrics(self, state: Dict[str, Any], service_level: float, inventory_health: float):
+        """
+        Update all performance metrics
+        
+        Args:
+            state: Current simulation state
+            service_level: Service level already computed by step()
+            inventory_health: Inventory health already computed by step()
+        """
+        metrics = self.metrics
+        
         # Core metrics
-        self.metrics['resilience_score'].append(self._calculate_resilience_score(state))
-        self.metrics['cost_impact'].append(self._calculate_cost_impact(state))
-        self.metrics['service_level'].append(self._calculate_service_level(state))
+        metrics['resilience_score'].append(self._calculate_resilience_score(state))
+        metrics['cost_impact'].append(self._calculate_cost_impact(state))
+        metrics['service_level'].append(service_level)
         
         # ROI calculation
-        investment_cost = sum(self._calculate_strategy_costs(state))
+        investment_cost = self._strategy_cost_total
         benefit = self._calculate_resilience_benefits(state)
-        self.metrics['roi'].append((benefit - investment_cost) / investment_cost if investment_cost > 0 else 0)
+        metrics['roi'].append((benefit - investment_cost) / investment_cost if investment_cost > 0 else 0)
         
         # Recovery time (if there are disruptions)
         if state['disruptions']:
-            self.metrics['recovery_time'].append(self._calculate_recovery_time(state))
+            metrics['recovery_time'].append(self._calculate_recovery_time(state))
         
         # Risk exposure
-        self.metrics['risk_exposure'].append(self._calculate_risk_exposure(state))
-        
-        # Regional metrics
-        for region in self.regions:
-            self.metrics['supplier_performance'][region].append(self._calculate_supplier_performance(region, state))
-            self.metrics['regional_performance'][region].append(self._calculate_regional_performance(region, state))
+        metrics['risk_exposure'].append(self._calculate_risk_exposure(state))
+        
+        # Regional metrics, walking the per-region histories alongside the kernel outputs
+        supplier_performance, regional_performance = self._calculate_all_regional_performance(state)
+        for supplier_history, regional_history, supplier_value, regional_value in zip(
+            metrics['supplier_performance'].values(), metrics['regional_performance'].values(),
+            supplier_performance.tolist(), regional_performance.tolist()
+        ):
+            supplier_history.append(supplier_value)
+            regional_history.append(regional_value)
             
         # Operational metrics
-        self.metrics['transportation_efficiency'].append(self._calculate_transportation_efficiency(state))
-        self.metrics['inventory_health'].append(self._calculate_inventory_health(state))
+        metrics['transportation_efficiency'].append(self._calculate_transportation_efficiency(state))
+        metrics['inventory_health'].append(inventory_health)
 
-    def _calculate_strategy_costs(self, state: Dict[str, Any]) -> List[float]:
-        """Calculate costs of resilience strategies"""
-        weights = self.config['metrics']['cost_weights']
-        return [
-            weights['supplier_diversification'] * 0.4,
-            weights['inventory_management'] * 0.3,
-            weights['transportation_flexibility'] * 0.2
-        ]
-        
     def _calculate_resilience_benefits(self, state: Dict[str, Any]) -> float:
         """Calculate benefits from resilience strategies"""
         if not state['disruptions']:
             return 0.0
             
-        potential_loss = sum(d['severity'] for d in state['disruptions'])
+        potential_loss = self._disruption_severity_stats(state)[0]
         actual_loss = potential_loss * (1 - self._calculate_resilience_score(state))
         return potential_loss - actual_loss
         
+    @_cached_per_step
     def _calculate_recovery_time(self, state: Dict[str, Any]) -> float:
         """
         Estimate recovery time from disruptions
@@ -209,21 +561,14 @@ class SupplyChainWorld(TinyWorld):
         if not state['disruptions']:
             return 0.0
             
-        max_severity = max(d['severity'] for d in state['disruptions'])
+        max_severity = self._disruption_severity_stats(state)[1]
         base_recovery = max_severity * 10  # Base recovery time in weeks
         
-        # Strategy effectiveness combines multiple approaches:
-        # - Supplier diversification (30%): Alternative sourcing speed
-        # - Inventory management (40%): Buffer against disruptions
-        # - Transportation flexibility (30%): Routing adaptability
-        strategy_effectiveness = (
-            self.config['metrics']['resilience_weights']['supplier_diversification'] * 0.3 +
-            self.config['metrics']['resilience_weights']['inventory_management'] * 0.4 +
-            self.config['metrics']['resilience_weights']['transportation_flexibility'] * 0.3
-        )
-        
-        return max(1, base_recovery * (1 - strategy_effectiveness))
+        # Strategy effectiveness combines supplier diversification, inventory management and
+        # transportation flexibility (precomputed from the resilience weights)
+        return max(1, base_recovery * (1 - self._strategy_effectiveness))
         
+    @_cached_per_step
     def _calculate_risk_exposure(self, state: Dict[str, Any]) -> float:
         """
         Calculate current risk exposure level
@@ -240,22 +585,41 @@ class SupplyChainWorld(TinyWorld):
         - 0.8-1.0: Critical risk
         """
         # Base risk calculation considers infrastructure quality and disaster probability
-        base_risk = sum(
-            region_data['disaster_probability'] * (1 - region_data['infrastructure_quality'])
-            for region_data in self.regions.values()
-        ) / len(self.regions)
+        base_risk = self._base_risk_const
         
         # Current disruptions impact (normalized by 10 to match risk scale)
-        current_disruption_impact = sum(d['severity'] for d in state['disruptions']) / 10 if state['disruptions'] else 0
+        current_disruption_impact = self._disruption_severity_stats(state)[0] / 10
         
         # Economic risk based on GDP volatility
-        economic_risk = np.mean([
-            abs(self.market_conditions['economic_indicators']['gdp_growth'].get(r, 0))
-            for r in self.regions
-        ])
+        economic_risk = sum(map(abs, self._gdp_growth.tolist())) / len(self.regions)
         
         return min(1.0, base_risk + current_disruption_impact + economic_risk)
         
+    @_cached_per_step
+    def _disruption_severity_stats(self, state: Dict[str, Any]) -> Tuple[float, float]:
+        """
+        Total and maximum severity of the state's disruptions, from a single pass
+        
+        Shared by every metric that weighs the current disruptions; both are 0.0 without disruptions.
+        For the world's own state they are read from the pre-computed disruption timeline.
+        """
+        if state is self.state and self._week_draws:
+            draws = self._week_draws
+            return float(draws['disruption_impact_total']), float(draws['disruption_impact_max'])
+        severities = [d['severity'] for d in state['disruptions']]
+        return sum(severities), max(severities, default=0.0)
+        
+    def _disruption_arrays(self, state: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the state's disruptions as (region index, severity) arrays"""
+        if state is self.state:
+            return self._current_disruption_arrays
+        if not state['disruptions']:
+            return _NO_DISRUPTIONS
+        return (
+            np.array([self._region_index[d['region']] for d in state['disruptions']], dtype=np.intp),
+            np.array([d['severity'] for d in state['disruptions']], dtype=float)
+        )
+        
     def _calculate_supplier_performance(self, region: str, state: Dict[str, Any]) -> float:
         """
         Calculate supplier performance score for a region
@@ -271,20 +635,9 @@ class SupplyChainWorld(TinyWorld):
         - 0.6-0.8: Fair (Needs improvement)
         - <0.6: Poor (Requires intervention)
         """
-        region_data = self.regions[region]
-        base_performance = region_data['infrastructure_quality']
-        
-        # Disruption impact (severity halved to model supplier resilience)
-        region_disruptions = [d for d in state['disruptions'] if d['region'] == region]
-        disruption_impact = sum(d['severity'] for d in region_disruptions) / 2 if region_disruptions else 0
-        
-        # Economic health impact on supplier performance
-        economic_impact = (
-            self.market_conditions['economic_indicators']['gdp_growth'].get(region, 0) -
-            self.market_conditions['economic_indicators']['inflation_rate'].get(region, 0)
-        )
-        
-        return max(0.0, min(1.0, base_performance - disruption_impact + economic_impact))
+        # Read from the all-region kernel output so the formula lives in one place
+        supplier_performance = self._calculate_all_regional_performance(state)[0]
+        return float(supplier_performance[self._region_index[region]])
         
     def _calculate_regional_performance(self, region: str, state: Dict[str, Any]) -> float:
         """
@@ -300,22 +653,25 @@ class SupplyChainWorld(TinyWorld):
         - Infrastructure problems cause ~30% of delays
         - Political/regulatory changes impact ~30% of operations
         """
-        supplier_score = self._calculate_supplier_performance(region, state)
-        infrastructure_score = self.regions[region]['infrastructure_quality']
-        stability_score = self.regions[region]['political_stability']
-        
-        weights = {
-            'supplier': 0.4,      # Primary factor in regional success
-            'infrastructure': 0.3, # Physical and tech capabilities
-            'stability': 0.3      # Business environment reliability
-        }
-        
-        return (
-            weights['supplier'] * supplier_score +
-            weights['infrastructure'] * infrastructure_score +
-            weights['stability'] * stability_score
+        # Read from the all-region kernel output so the weighting lives in one place
+        regional_performance = self._calculate_all_regional_performance(state)[1]
+        return float(regional_performance[self._region_index[region]])
+        
+    @_cached_per_step
+    def _calculate_all_regional_performance(self, state: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Gather per-region state into arrays and run the regional performance kernel"""
+        region_indices, severities = self._disruption_arrays(state)
+        disruption_severity = np.bincount(region_indices, weights=severities, minlength=len(self.regions))
+        
+        return _regional_performance_kernel(
+            self._infrastructure_quality,
+            self._political_stability,
+            disruption_severity,
+            self._gdp_growth,
+            self._inflation_rate
         )
         
+    @_cached_per_step
     def _calculate_transportation_efficiency(self, state: Dict[str, Any]) -> float:
         """
         Calculate transportation network efficiency
@@ -332,18 +688,15 @@ class SupplyChainWorld(TinyWorld):
         - <0.70: Poor performance (Significant delays)
         """
         # Base efficiency from infrastructure
-        base_efficiency = np.mean([
-            region_data['infrastructure_quality']
-            for region_data in self.regions.values()
-        ])
+        base_efficiency = self._base_transport_eff_const
         
         # Impact of current disruptions
-        disruption_impact = sum(d['severity'] for d in state['disruptions']) / len(self.regions) if state['disruptions'] else 0
+        disruption_impact = self._disruption_severity_stats(state)[0] / len(self.regions)
         
         # Adjust for transportation flexibility strategy
         flexibility_factor = self.config['resilience_strategies']['transportation_flexibility']['resilience_impact']
         
-        return max(0.0, min(1.0, base_efficiency - (disruption_impact * (1 - flexibility_factor))))
+        return _clamp01(base_efficiency - (disruption_impact * (1 - flexibility_factor)))
         
     def _calculate_inventory_health(self, state: Dict[str, Any]) -> float:
         """
@@ -379,7 +732,7 @@ class SupplyChainWorld(TinyWorld):
             0.3 * matching_score         # Demand matching capability
         )
         
-        return max(0.0, min(1.0, inventory_health))
+        return _clamp01(inventory_health)
 
     def _calculate_resilience_score(self, state: Dict[str, Any]) -> float:
         """
@@ -403,11 +756,11 @@ class SupplyChainWorld(TinyWorld):
         risk_score = 1.0 - self._calculate_risk_exposure(state)
         
         # Operational stability
-        stability_score = np.mean([
-            state.get('service_level', 1.0),
-            self._calculate_transportation_efficiency(state),
+        stability_score = (
+            state.get('service_level', 1.0) +
+            self._calculate_transportation_efficiency(state) +
             state.get('inventory_health', 1.0)
-        ])
+        ) / 3
         
         # Weighted combination
         resilience_score = (
@@ -416,7 +769,7 @@ class SupplyChainWorld(TinyWorld):
             0.3 * stability_score
         )
         
-        return max(0.0, min(1.0, resilience_score))
+        return _clamp01(resilience_score)
 
     def _calculate_service_level(self, state: Dict[str, Any]) -> float:
         """
@@ -431,11 +784,9 @@ class SupplyChainWorld(TinyWorld):
         base_service_level = 0.98  # Industry standard target
         
         # Calculate impacts
-        disruption_impact = sum(d['severity'] for d in state['disruptions']) / 20.0
-        regional_impact = np.mean([
-            self._calculate_regional_performance(region, state)
-            for region in self.regions
-        ])
+        disruption_impact = self._disruption_severity_stats(state)[0] / 20.0
+        regional_performance = self._calculate_all_regional_performance(state)[1].tolist()
+        regional_impact = sum(regional_performance) / len(regional_performance)
         
         # Get inventory health directly from state if available, otherwise use base value
         inventory_impact = state.get('inventory_health', 0.9)  # Use stored value or default
@@ -448,24 +799,14 @@ class SupplyChainWorld(TinyWorld):
             inventory_impact
         )
         
-        return max(0.0, min(1.0, service_level))
+        return _clamp01(service_level)
         
-    def _calculate_reward(self, state: Dict[str, Any]) -> float:
-        """Calculate reward based on service level and cost impact"""
-        service_level = state.get('service_level', 0)
-        cost_impact = self._calculate_cost_impact(state)
-        return service_level - (cost_impact * 0.5)  # Reward high service level while penalizing high costs
-        
-    def _is_done(self, state: Dict[str, Any]) -> bool:
-        """Check if simulation should end"""
-        return self.current_time >= self.config['simulation']['max_steps']
-
     def get_state(self) -> Dict[str, Any]:
         """Return current world state"""
         return {
             'time': self.current_time,
             'regions': self.regions,
-            'disruptions': [d for d in self.disruption_events if d['time'] == self.current_time],
+            'disruptions': list(self.current_disruptions),
             'metrics': {
                 'resilience_score': self.metrics['resilience_score'][-1] if self.metrics['resilience_score'] else 1.0,
                 'cost_impact': self.metrics['cost_impact'][-1] if self.metrics['cost_impact'] else 0.0,
@@ -473,63 +814,71 @@ class SupplyChainWorld(TinyWorld):
             }
         }
         
+    @property
+    def disruption_events(self) -> List[Dict[str, Any]]:
+        """Every disruption so far, oldest first, as event dicts rebuilt from the history arrays"""
+        return self._disruption_log.events(self._region_names, self._disruption_types)
+        
     def _generate_disruptions(self):
         """Generate random disruption events based on regional probabilities"""
-        for region_name, region_data in self.regions.items():
-            if np.random.random() < region_data['disaster_probability']:
-                disruption_type = np.random.choice(self.config['simulation']['disruption_types'])
-                severity = self._calculate_disruption_severity(region_name, disruption_type)
-                
-                self.disruption_events.append({
-                    'time': self.current_time,
-                    'region': region_name,
-                    'type': disruption_type,
-                    'severity': severity
-                })
-                
-    def _calculate_disruption_severity(self, region: str, disruption_type: str) -> float:
-        """Calculate disruption severity based on region and type"""
-        base_severity = np.random.uniform(0.1, 1.0)
-        region_data = self.regions[region]
-        
-        # Adjust severity based on region characteristics
-        if disruption_type == 'natural':
-            severity = base_severity * (1 - region_data['infrastructure_quality'])
-        elif disruption_type == 'political':
-            severity = base_severity * (1 - region_data['political_stability'])
-        else:  # infrastructure
-            severity = base_severity * (1 - region_data['infrastructure_quality'])
+        draws = self._week_draws
+        # Drop last week's views; new lists so earlier weeks' states and perceptions keep their own
+        self.current_disruptions = []
+        self.disruptions_by_time_region.clear()
+        self._current_disruption_arrays = _NO_DISRUPTIONS
+        
+        # Regions hit this week, with their disruption type ids and severities, as arrays
+        region_indices = np.flatnonzero(draws['disruption_impact'])
+        if not region_indices.size:
+            return
+        type_ids = draws['disruption_type'][region_indices]
+        severities = draws['disruption_impact'][region_indices]
+        self._current_disruption_arrays = (region_indices, severities)
+        self._disruption_log.extend(self.current_time, region_indices, type_ids, severities)
+        
+        # Event records carry the region and type names
+        for i, type_id, severity in zip(region_indices.tolist(), type_ids.tolist(), severities.tolist()):
+            region_name = self._region_names[i]
+            event = {
+                'time': self.current_time,
+                'region': region_name,
+                'type': self._disruption_types[type_id],
+                'severity': severity
+            }
+            self.current_disruptions.append(event)
+            self.disruptions_by_time_region[(self.current_time, region_name)].append(event)
             
-        return max(0.1, min(1.0, severity))
-        
+    @_cached_per_step
     def _calculate_cost_impact(self, state: Dict[str, Any]) -> float:
         """Calculate cost impact of current state"""
-        weights = self.config['metrics']['cost_weights']
-        disruption_cost = sum(d['severity'] * 0.5 for d in state['disruptions'])
+        disruption_cost = self._disruption_severity_stats(state)[0] * 0.5
+        return self._strategy_cost_total + disruption_cost
         
-        strategy_cost = (
-            weights['supplier_diversification'] * 0.4 +
-            weights['inventory_management'] * 0.3 +
-            weights['transportation_flexibility'] * 0.2
-        )
+    def get_metrics_summary(self) -> Dict[str, float]:
+        """
+        Return summary statistics of simulation metrics, from the histories' running totals
         
-        return strategy_cost + disruption_cost
+        The summary is built once per step and reused by later calls; each call gets its own copy.
+        """
+        if self._metrics_summary is None:
+            self._metrics_summary = self._build_metrics_summary()
+        return dict(self._metrics_summary)
         
-    def get_metrics_summary(self) -> Dict[str, float]:
-        """Return summary statistics of simulation metrics"""
+    def _build_metrics_summary(self) -> Dict[str, float]:
+        """Build the summary returned by get_metrics_summary"""
         return {
-            'avg_resilience': np.mean(self.metrics['resilience_score']),
-            'avg_cost_impact': np.mean(self.metrics['cost_impact']),
-            'avg_service_level': np.mean(self.metrics['service_level']),
-            'min_service_level': min(self.metrics['service_level']),
-            'max_cost_impact': max(self.metrics['cost_impact']),
-            'avg_roi': np.mean(self.metrics['roi']) if self.metrics['roi'] else 0.0,
-            'avg_recovery_time': np.mean(self.metrics['recovery_time']) if self.metrics['recovery_time'] else 0.0,
-            'avg_risk_exposure': np.mean(self.metrics['risk_exposure']),
-            'transportation_efficiency': np.mean(self.metrics['transportation_efficiency']),
-            'inventory_health': np.mean(self.metrics['inventory_health']),
+            'avg_resilience': self.metrics['resilience_score'].mean(),
+            'avg_cost_impact': self.metrics['cost_impact'].mean(),
+            'avg_service_level': self.metrics['service_level'].mean(),
+            'min_service_level': self.metrics['service_level'].min(),
+            'max_cost_impact': self.metrics['cost_impact'].max(),
+            'avg_roi': self.metrics['roi'].mean() if self.metrics['roi'] else 0.0,
+            'avg_recovery_time': self.metrics['recovery_time'].mean() if self.metrics['recovery_time'] else 0.0,
+            'avg_risk_exposure': self.metrics['risk_exposure'].mean(),
+            'transportation_efficiency': self.metrics['transportation_efficiency'].mean(),
+            'inventory_health': self.metrics['inventory_health'].mean(),
             **{
-                f'supplier_performance_{region}': np.mean(perf)
+                f'supplier_performance_{region}': perf.mean()
                 for region, perf in self.metrics['supplier_performance'].items()
             }
         } 
\ No newline at end of file
@@ -0,0 +1,59 @@
+import unittest
+import copy
+import functools
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pandas as pd
+from tinytroupe.environment.tiny_world import TinyWorld
+from supply_chain_config import DEFAULT_CONFIG
+from supply_chain_environment import SupplyChainWorld
+from scenario_manager import ScenarioManager
+from monte_carlo_runner import MonteCarloSimulation
+
+def _small_config(seed: int = 42):
+    """Default configuration shrunk to a few short iterations"""
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['simulation']['monte_carlo_iterations'] = 6
+    config['simulation']['simulation_length_weeks'] = 12
+    config['simulation']['seed'] = seed
+    return config
+
+class TestReproducibility(unittest.TestCase):
+    def test_world_is_seeded_from_config(self):
+        """Worlds built directly from the same config produce the same metrics"""
+        summaries = []
+        for _ in range(2):
+            TinyWorld.all_environments.clear()  # World names must be unique
+            world = SupplyChainWorld(_small_config())
+            for _ in range(12):
+                world.step()
+            summaries.append(world.get_metrics_summary())
+        self.assertEqual(summaries[0], summaries[1])
+
+    def test_same_seed_same_results(self):
+        """Two runs with the same seed give identical results"""
+        first = MonteCarloSimulation(_small_config(), max_workers=1).run()
+        second = MonteCarloSimulation(_small_config(), max_workers=1).run()
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_results_independent_of_worker_count(self):
+        """In-process and pooled runs with the same seed give identical results"""
+        serial = MonteCarloSimulation(_small_config(), max_workers=1).run()
+        pooled = MonteCarloSimulation(_small_config(), max_workers=2).run()
+        pd.testing.assert_frame_equal(serial, pooled)
+
+class TestReadOnlyConfig(unittest.TestCase):
+    def test_read_only_config_runs_on_spawned_workers(self):
+        """A frozen scenario config can be handed to a process pool using spawn"""
+        config = ScenarioManager.get_scenario_config_readonly('baseline')
+        spawn_pool = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn'))
+        with mock.patch('monte_carlo_runner.ProcessPoolExecutor', spawn_pool):
+            results = MonteCarloSimulation(config, max_workers=2).run()
+        self.assertEqual(len(results), config['simulation']['monte_carlo_iterations'])
+
+if __name__ == '__main__':
+    unittest.main()
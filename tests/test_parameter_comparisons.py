@@ -7,13 +7,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from supply_chain_simulation import SupplyChainEnvironment, SupplyChainAgent, SupplyChainSimulation
 
 class TestParameterComparisons(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Create test_results directory if it doesn't exist
-        self.base_results_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_results')
-        os.makedirs(self.base_results_dir, exist_ok=True)
+        cls.base_results_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_results')
+        os.makedirs(cls.base_results_dir, exist_ok=True)
         
         # Number of iterations for each test
-        self.num_iterations = 100
+        cls.num_iterations = 100
+        
+        # Run the baseline simulation once; every comparison reuses its results
+        baseline_sim = SupplyChainSimulation(num_iterations=cls.num_iterations)
+        baseline_sim.run()
+        cls.baseline_results = baseline_sim.analyze_results()
         
     def run_simulation_with_params(self, test_name, modified_params=None):
         """Run simulation with modified parameters and store results"""
@@ -21,10 +27,8 @@ class TestParameterComparisons(unittest.TestCase):
         test_dir = os.path.join(self.base_results_dir, test_name)
         os.makedirs(test_dir, exist_ok=True)
         
-        # Run baseline simulation
-        baseline_sim = SupplyChainSimulation(num_iterations=self.num_iterations)
-        baseline_sim.run()
-        baseline_results = baseline_sim.analyze_results()
+        # Baseline results are shared across tests, see setUpClass
+        baseline_results = self.baseline_results
         
         # Run modified simulation
         if modified_params:
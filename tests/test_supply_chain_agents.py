@@ -0,0 +1,43 @@
+import unittest
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tinytroupe.agent.tiny_person import TinyPerson
+from tinytroupe.environment.tiny_world import TinyWorld
+from supply_chain_config import DEFAULT_CONFIG
+from supply_chain_agents import SupplyChainAgent
+from supply_chain_environment import SupplyChainWorld
+
+class TestBatchedDecisions(unittest.TestCase):
+    def setUp(self):
+        TinyWorld.all_environments.clear()
+        TinyPerson.all_agents.clear()
+        self.world = SupplyChainWorld(DEFAULT_CONFIG)
+        self.world.reset(42)
+        self.agents = []
+        for region in DEFAULT_CONFIG['regions']:
+            self.agents.append(SupplyChainAgent(
+                name=f'manager_{region}', role='Regional_Manager', region=region,
+                config=DEFAULT_CONFIG['regional_manager']
+            ))
+            self.agents.append(SupplyChainAgent(
+                name=f'supplier_{region}', role='Supplier', region=region,
+                config=DEFAULT_CONFIG['supplier']
+            ))
+
+    def test_batch_matches_individual_decisions(self):
+        """Batched decisions equal per-agent decisions on the same world state"""
+        disrupted_weeks = 0
+        for _ in range(DEFAULT_CONFIG['simulation']['simulation_length_weeks']):
+            self.world.step()
+            disrupted_weeks += bool(self.world.current_disruptions)
+
+            batched = SupplyChainAgent.make_decisions_batch(self.agents, self.world)
+            individual = [agent.make_decision(self.world) for agent in self.agents]
+            self.assertEqual(batched, individual)
+
+        # The comparison covered weeks with disruptions, not only the no-disruption defaults
+        self.assertGreater(disrupted_weeks, 0)
+
+if __name__ == '__main__':
+    unittest.main()